@@ -0,0 +1,67 @@
+"""Store JSON columns as JSONB and add a GIN index on story_analytics.events
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSONB_COLUMNS = {
+    'story_versions': ['sources_snapshot', 'token_stats'],
+    'feed_items': ['raw'],
+    'story_analytics': [
+        'sentiment_score',
+        'bias_indicators',
+        'bias_score',
+        'source_analysis',
+        'fact_checks',
+        'predictions',
+        'events',
+    ],
+}
+
+
+def upgrade() -> None:
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                existing_type=postgresql.JSON(astext_type=sa.Text()),
+                postgresql_using=f'{column}::jsonb',
+            )
+
+    op.create_index(
+        'ix_story_analytics_events_gin',
+        'story_analytics',
+        ['events'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'events': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_story_analytics_events_gin', table_name='story_analytics')
+
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSON(astext_type=sa.Text()),
+                existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                postgresql_using=f'{column}::json',
+            )
@@ -0,0 +1,41 @@
+"""Store feed_items.content_hash as a raw SHA-256 digest
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 64-char hex digests become 32-byte values; PostgreSQL rebuilds the unique index
+    op.alter_column(
+        'feed_items',
+        'content_hash',
+        type_=postgresql.BYTEA(),
+        existing_type=sa.String(),
+        existing_nullable=False,
+        postgresql_using="decode(content_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'feed_items',
+        'content_hash',
+        type_=sa.String(),
+        existing_type=postgresql.BYTEA(),
+        existing_nullable=False,
+        postgresql_using="encode(content_hash, 'hex')",
+    )
@@ -0,0 +1,81 @@
+"""Reference story_versions from generated_images and story_analytics
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # generated_images was previously only created by init_db's create_all
+    if not inspector.has_table('generated_images'):
+        op.create_table(
+            'generated_images',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.Column('story_version_id', sa.Integer(), nullable=False),
+            sa.Column('prompt', sa.Text(), nullable=False),
+            sa.Column('image_url', sa.String(), nullable=False),
+            sa.Column('revised_prompt', sa.Text(), nullable=True),
+            sa.Column('model', sa.String(), nullable=False),
+            sa.Column('size', sa.String(), nullable=False),
+            sa.Column('quality', sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_generated_images_id'), 'generated_images', ['id'], unique=False)
+        op.create_index(op.f('ix_generated_images_created_at'), 'generated_images', ['created_at'], unique=False)
+    else:
+        # Superseded by the composite index below
+        indexes = {index['name'] for index in inspector.get_indexes('generated_images')}
+        if 'ix_generated_images_story_version_id' in indexes:
+            op.drop_index('ix_generated_images_story_version_id', table_name='generated_images')
+
+    # Rows for deleted stories would violate the new constraints
+    for table in ('generated_images', 'story_analytics'):
+        op.execute(
+            f'DELETE FROM {table} WHERE story_version_id NOT IN (SELECT id FROM story_versions)'
+        )
+
+    op.create_index(
+        'ix_generated_images_story_created',
+        'generated_images',
+        ['story_version_id', 'created_at'],
+        unique=False,
+    )
+    op.create_foreign_key(
+        'generated_images_story_version_id_fkey',
+        'generated_images', 'story_versions',
+        ['story_version_id'], ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'story_analytics_story_version_id_fkey',
+        'story_analytics', 'story_versions',
+        ['story_version_id'], ['id'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('story_analytics_story_version_id_fkey', 'story_analytics', type_='foreignkey')
+    op.drop_constraint('generated_images_story_version_id_fkey', 'generated_images', type_='foreignkey')
+    op.drop_index('ix_generated_images_story_created', table_name='generated_images')
+    op.create_index(
+        op.f('ix_generated_images_story_version_id'),
+        'generated_images',
+        ['story_version_id'],
+        unique=False,
+    )
@@ -0,0 +1,51 @@
+"""Re-key feed_items.content_hash with a 16-byte BLAKE2b digest
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+feed_items = sa.table(
+    'feed_items',
+    sa.column('id', sa.Integer()),
+    sa.column('link', sa.String()),
+    sa.column('title', sa.String()),
+    sa.column('content_hash', sa.LargeBinary()),
+)
+
+
+def _rehash(digest) -> None:
+    """Recompute content_hash for every row from its link and title."""
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(feed_items.c.id, feed_items.c.link, feed_items.c.title)).all()
+    if not rows:
+        return
+    bind.execute(
+        feed_items.update()
+        .where(feed_items.c.id == sa.bindparam('row_id'))
+        .values(content_hash=sa.bindparam('new_hash')),
+        [
+            {'row_id': row.id, 'new_hash': digest(f"{row.link}|{row.title}".encode('utf-8'))}
+            for row in rows
+        ],
+    )
+
+
+def upgrade() -> None:
+    _rehash(lambda content: hashlib.blake2b(content, digest_size=16).digest())
+
+
+def downgrade() -> None:
+    _rehash(lambda content: hashlib.sha256(content).digest())
@@ -0,0 +1,31 @@
+"""Add partial index on active feed configurations by priority
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_feed_configurations_active_priority',
+        'feed_configurations',
+        [sa.text('priority DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feed_configurations_active_priority', table_name='feed_configurations')
@@ -0,0 +1,49 @@
+"""Compress long text columns with LZ4 instead of pglz
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TEXT_COLUMNS = {
+    'story_versions': ['full_text', 'summary', 'context_summary'],
+    'feed_items': ['summary'],
+}
+
+
+def _lz4_available() -> bool:
+    """Per-column compression needs PostgreSQL 14+ built with LZ4 support."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+    return bool(bind.execute(sa.text(
+        "SELECT 'lz4' = ANY(enumvals) FROM pg_settings WHERE name = 'default_toast_compression'"
+    )).scalar())
+
+
+def _set_compression(method: str) -> None:
+    # Applies to newly written values; existing rows keep their codec until rewritten
+    for table, columns in TEXT_COLUMNS.items():
+        for column in columns:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method}')
+
+
+def upgrade() -> None:
+    if _lz4_available():
+        _set_compression('lz4')
+
+
+def downgrade() -> None:
+    if _lz4_available():
+        _set_compression('pglz')
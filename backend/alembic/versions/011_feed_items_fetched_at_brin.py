@@ -0,0 +1,32 @@
+"""Add BRIN index on feed_items.fetched_at
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_feed_items_fetched_at_brin',
+        'feed_items',
+        ['fetched_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feed_items_fetched_at_brin', table_name='feed_items')
@@ -5,10 +5,10 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from openai import OpenAI
 
 from .models import StoryVersion, StoryAnalytics, FeedItem
 from .config import settings
+from .openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ class AnalyticsService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = settings.singl_model_name
 
     def analyze_story(self, story: StoryVersion) -> Optional[StoryAnalytics]:
@@ -1,23 +1,28 @@
 """REST API endpoints."""
+import hmac
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+import re
 from fastapi.responses import StreamingResponse
 import secrets
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Header
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request, Response
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func, insert, or_, select, update
 from typing import List, Optional
+from cachetools import TTLCache
 
 from .database import get_db
 from .story_service import StoryService
 from .quote_service import QuoteExtractor
-from .image_service import QuoteImageGenerator
+from .image_service import IMAGE_FORMATS, render_quote_image
 from .analytics_service import AnalyticsService
 from .models import FeedItem, FeedConfiguration, StoryVersion, GeneratedImage, UserSettings, StoryAnalytics
 from .schemas import (
     StoryVersionResponse,
+    StoryVersionDetailResponse,
     StoryVersionSummary,
     MetaResponse,
     HealthResponse,
@@ -49,7 +54,7 @@ from .schemas import (
     Prediction,
 )
 from .config import settings
-from .auth import require_auth, get_admin_api_key
+from .auth import require_auth, get_admin_api_key, security
 
 logger = logging.getLogger(__name__)
 
@@ -57,9 +62,61 @@ router = APIRouter(prefix="/api")
 
 # Simple in-memory token store (in production, use Redis or similar)
 _active_tokens = {}
-_app_start_time = datetime.now()
+# Monotonic so uptime is immune to wall-clock adjustments
+_app_start_monotonic = time.monotonic()
+
+_CAPITALIZED_WORD_RE = re.compile(r'\b[A-Z][a-z]+\b')
+
+# Dashboards poll /stats every few seconds; serve bursts from memory
+_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=5)
+_stats_cache_lock = threading.Lock()
+
+# Control panel config changes through update_config, which clears this and
+# bumps the generation; the TTL bounds staleness from other worker processes
+_config_response_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+_config_cache_lock = threading.Lock()
+_config_cache_generation = 0
+
+# Settings the control panel may change at runtime
+_UPDATABLE_CONFIG_FIELDS = frozenset({
+    "singl_model_name",
+    "singl_update_minutes",
+    "singl_context_steps",
+    "singl_temperature",
+    "singl_max_tokens",
+    "singl_image_generation_enabled",
+    "singl_image_generation_interval",
+    "singl_image_model",
+    "singl_image_size",
+    "singl_image_quality",
+    "singl_feeds",
+})
+
+# Story versions and generated images are never modified once written
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _immutable_etag(kind: str, resource_id: int, created_at: datetime, suffix: str = "") -> str:
+    """Build a strong ETag for an immutable resource, optionally qualified by a suffix."""
+    return f'"{kind}-{resource_id}-{int(created_at.timestamp())}{suffix}"'
+
+
+def _conditional_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Apply immutable caching headers and short-circuit revalidation requests.
+
+    Returns:
+        A 304 response if the client already holds this ETag, otherwise None
+        (the caching headers are set on ``response``).
+    """
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
 
-security = HTTPBearer()
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
 
 
 def create_auth_token() -> str:
@@ -87,7 +144,7 @@ def verify_auth_token(credentials: HTTPAuthorizationCredentials = Depends(securi
 def get_current_story(db: Session = Depends(get_db)):
     """Get the latest story version."""
     service = StoryService(db)
-    story = service.get_latest_story()
+    story = service.get_latest_story_response()
 
     if not story:
         raise HTTPException(status_code=404, detail="No stories available yet")
@@ -133,15 +190,46 @@ def get_story_history(
     return summaries
 
 
-@router.get("/story/{story_id}", response_model=StoryVersionResponse)
-def get_story_by_id(story_id: int, db: Session = Depends(get_db)):
-    """Get a specific story version by ID."""
+@router.get("/story/{story_id}", response_model=StoryVersionDetailResponse)
+def get_story_by_id(
+    story_id: int,
+    request: Request,
+    response: Response,
+    include: List[str] = Query(default=[]),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a specific story version by ID.
+
+    Args:
+        story_id: Story version ID
+        include: Related resources to embed (supports "image")
+    """
+    include_image = "image" in include
+
     service = StoryService(db)
-    story = service.get_story_by_id(story_id)
+    story = service.get_story_by_id(story_id, include_image=include_image)
 
     if not story:
         raise HTTPException(status_code=404, detail=f"Story {story_id} not found")
 
+    # The image is attached after the story is written, so only cache once it exists
+    if not include_image:
+        etag = _immutable_etag("story", story.id, story.created_at)
+    elif story.image:
+        etag = _immutable_etag("story", story.id, story.created_at, f"-image-{story.image.id}")
+    else:
+        etag = None
+
+    if etag:
+        not_modified = _conditional_response(request, response, etag)
+        if not_modified:
+            return not_modified
+
+    if not include_image:
+        # Serialize without touching the relationship to avoid a lazy image query
+        return StoryVersionResponse.model_validate(story)
+
     return story
 
 
@@ -150,7 +238,7 @@ def get_meta(db: Session = Depends(get_db)):
     """Get metadata about the service."""
     service = StoryService(db)
 
-    latest_story = service.get_latest_story()
+    latest_story_at = service.get_latest_story_time()
     story_count = service.get_story_count()
 
     feed_urls = settings.get_feed_list()
@@ -160,7 +248,7 @@ def get_meta(db: Session = Depends(get_db)):
         feed_count=len(feed_urls),
         update_minutes=settings.singl_update_minutes,
         context_steps=settings.singl_context_steps,
-        last_update=latest_story.created_at if latest_story else None,
+        last_update=latest_story_at,
         story_count=story_count,
         model_name=settings.singl_model_name,
     )
@@ -172,13 +260,13 @@ def health_check(db: Session = Depends(get_db)):
     try:
         # Test database connection
         service = StoryService(db)
-        latest_story = service.get_latest_story()
+        latest_story_at = service.get_latest_story_time()
         story_count = service.get_story_count()
 
         return HealthResponse(
             status="healthy",
             database_connected=True,
-            last_story_at=latest_story.created_at if latest_story else None,
+            last_story_at=latest_story_at,
             story_count=story_count,
         )
     except Exception as e:
@@ -224,6 +312,7 @@ def get_story_quotes(story_id: int, count: int = 5, db: Session = Depends(get_db
 def get_quote_image(
     story_id: int,
     quote_index: int = 0,
+    format: str = "png",
     db: Session = Depends(get_db)
 ):
     """
@@ -232,10 +321,14 @@ def get_quote_image(
     Args:
         story_id: Story version ID
         quote_index: Index of the quote to generate image for (0-based, default 0)
+        format: Image format, "png" (default) or "webp"
 
     Returns:
-        PNG image of the quote card
+        PNG or WebP image of the quote card
     """
+    if format not in IMAGE_FORMATS:
+        raise HTTPException(status_code=400, detail="Format must be 'png' or 'webp'")
+
     logger.info(f"Generating quote image for story {story_id}, quote index {quote_index}")
 
     service = StoryService(db)
@@ -266,11 +359,11 @@ def get_quote_image(
     # Generate image
     try:
         logger.info(f"Generating image for quote: {quote['text'][:50]}...")
-        generator = QuoteImageGenerator()
-        image_bytes = generator.generate_quote_image(
+        image_bytes = render_quote_image(
             quote_text=quote['text'],
             category=quote['category'],
-            absurdity_score=quote['absurdity_score']
+            absurdity_score=quote['absurdity_score'],
+            image_format=format,
         )
         logger.info(f"Image generated successfully for story {story_id}")
     except Exception as e:
@@ -279,15 +372,20 @@ def get_quote_image(
 
     return StreamingResponse(
         image_bytes,
-        media_type="image/png",
+        media_type=IMAGE_FORMATS[format][0],
         headers={
-            "Content-Disposition": f"inline; filename=singl_quote_{story_id}_{quote_index}.png"
+            "Content-Disposition": f"inline; filename=singl_quote_{story_id}_{quote_index}.{format}"
         }
     )
 
 
 @router.get("/story/{story_id}/sources", response_model=SourcesResponse)
-def get_story_sources(story_id: int, db: Session = Depends(get_db)):
+def get_story_sources(
+    story_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """
     Get detailed source information for a specific story.
 
@@ -300,6 +398,12 @@ def get_story_sources(story_id: int, db: Session = Depends(get_db)):
     if not story:
         raise HTTPException(status_code=404, detail=f"Story {story_id} not found")
 
+    not_modified = _conditional_response(
+        request, response, _immutable_etag("story", story.id, story.created_at)
+    )
+    if not_modified:
+        return not_modified
+
     if not story.sources_snapshot or "feed_items" not in story.sources_snapshot:
         return SourcesResponse(
             story_id=story_id,
@@ -329,7 +433,12 @@ def get_story_sources(story_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/story/{story_id}/seo", response_model=SEOMetadata)
-def get_story_seo(story_id: int, db: Session = Depends(get_db)):
+def get_story_seo(
+    story_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """
     Get SEO metadata for a specific story.
 
@@ -342,10 +451,19 @@ def get_story_seo(story_id: int, db: Session = Depends(get_db)):
     if not story:
         raise HTTPException(status_code=404, detail=f"Story {story_id} not found")
 
-    # Extract keywords from summary
-    import re
-    words = re.findall(r'\b[A-Z][a-z]+\b', story.summary)
-    keywords = list(set(words))[:10]  # Unique capitalized words as keywords
+    not_modified = _conditional_response(
+        request, response, _immutable_etag("story", story.id, story.created_at)
+    )
+    if not_modified:
+        return not_modified
+
+    # Unique capitalized words as keywords, stopping once we have ten
+    seen = {}
+    for match in _CAPITALIZED_WORD_RE.finditer(story.summary):
+        seen[match.group()] = None
+        if len(seen) == 10:
+            break
+    keywords = list(seen)
 
     # Add some standard keywords
     keywords.extend(["UnioNews", "unified news", "continuous narrative", "news synthesis"])
@@ -389,7 +507,8 @@ def get_api_docs():
                 "method": "GET",
                 "path": "/api/story/{story_id}",
                 "description": "Get a specific story version",
-                "response": "StoryVersionResponse"
+                "params": ["include (image)"],
+                "response": "StoryVersionDetailResponse"
             },
             {
                 "method": "GET",
@@ -470,7 +589,7 @@ async def login(request: LoginRequest):
     import os
     admin_password = os.getenv('SINGL_ADMIN_PASSWORD', 'singl2025')
 
-    if request.password != admin_password:
+    if not hmac.compare_digest(request.password.encode("utf-8", "replace"), admin_password.encode("utf-8")):
         raise HTTPException(status_code=401, detail="Invalid password")
 
     return LoginResponse(
@@ -498,22 +617,70 @@ async def get_api_key_info(auth: str = Depends(require_auth)):
 
 @router.get("/feeds", response_model=List[FeedConfigurationResponse])
 def get_feeds(
+    request: Request,
+    response: Response,
     active_only: bool = False,
+    limit: int = Query(100, ge=1, le=200),
+    after_priority: Optional[int] = None,
+    after_name: Optional[str] = None,
+    after_id: Optional[int] = None,
     db: Session = Depends(get_db),
     auth: str = Depends(require_auth)
 ):
     """
-    Get all configured RSS feeds.
+    Get configured RSS feeds, ordered by priority then name, using keyset pagination.
+
+    When more feeds may follow, a ``Link: <...>; rel="next"`` header carries
+    the cursor for the next page.
 
     Args:
         active_only: If True, only return active feeds
+        limit: Number of feeds to return (max 200)
+        after_priority: Priority of the last feed on the previous page
+        after_name: Name of the last feed on the previous page
+        after_id: ID of the last feed on the previous page
     """
     query = db.query(FeedConfiguration)
 
     if active_only:
         query = query.filter(FeedConfiguration.is_active == True)
 
-    feeds = query.order_by(FeedConfiguration.priority.desc(), FeedConfiguration.name).all()
+    # Resume after the cursor row in (priority desc, name, id) order
+    if after_priority is not None and after_name is not None and after_id is not None:
+        query = query.filter(
+            or_(
+                FeedConfiguration.priority < after_priority,
+                and_(
+                    FeedConfiguration.priority == after_priority,
+                    or_(
+                        FeedConfiguration.name > after_name,
+                        and_(
+                            FeedConfiguration.name == after_name,
+                            FeedConfiguration.id > after_id,
+                        ),
+                    ),
+                ),
+            )
+        )
+
+    feeds = (
+        query.order_by(
+            FeedConfiguration.priority.desc(),
+            FeedConfiguration.name,
+            FeedConfiguration.id,
+        )
+        .limit(limit)
+        .all()
+    )
+
+    if feeds and len(feeds) == limit:
+        last = feeds[-1]
+        next_url = request.url.include_query_params(
+            limit=limit, after_priority=last.priority, after_name=last.name, after_id=last.id
+        )
+        # Relative, so it stays valid behind the frontend proxy
+        response.headers["Link"] = f'<{next_url.path}?{next_url.query}>; rel="next"'
+
     return feeds
 
 
@@ -536,13 +703,16 @@ def create_feed(feed: FeedConfigurationCreate, db: Session = Depends(get_db), au
     if existing:
         raise HTTPException(status_code=400, detail="Feed URL already exists")
 
-    db_feed = FeedConfiguration(**feed.dict())
-    db.add(db_feed)
+    # RETURNING hands back server defaults (id, created_at) without a re-SELECT
+    db_feed = db.execute(
+        insert(FeedConfiguration).values(**feed.dict()).returning(FeedConfiguration)
+    ).scalar_one()
+    # Serialize before commit expires the instance
+    result = FeedConfigurationResponse.model_validate(db_feed, from_attributes=True)
     db.commit()
-    db.refresh(db_feed)
 
-    logger.info(f"Created new feed: {db_feed.name} ({db_feed.url})")
-    return db_feed
+    logger.info(f"Created new feed: {result.name} ({result.url})")
+    return result
 
 
 @router.put("/feeds/{feed_id}", response_model=FeedConfigurationResponse)
@@ -553,31 +723,38 @@ def update_feed(
     auth: str = Depends(require_auth)
 ):
     """Update an existing feed configuration."""
-    db_feed = db.query(FeedConfiguration).filter(FeedConfiguration.id == feed_id).first()
-
-    if not db_feed:
-        raise HTTPException(status_code=404, detail=f"Feed {feed_id} not found")
-
     # Update only provided fields
     update_data = feed_update.dict(exclude_unset=True)
 
-    # Check if URL is being changed and if it conflicts
-    if "url" in update_data and update_data["url"] != db_feed.url:
-        existing = db.query(FeedConfiguration).filter(
-            FeedConfiguration.url == update_data["url"],
-            FeedConfiguration.id != feed_id
-        ).first()
-        if existing:
-            raise HTTPException(status_code=400, detail="Feed URL already exists")
+    if update_data:
+        stmt = update(FeedConfiguration).where(FeedConfiguration.id == feed_id)
+        if "url" in update_data:
+            # Match nothing if another feed already uses the URL
+            other = aliased(FeedConfiguration)
+            stmt = stmt.where(
+                ~select(other.id)
+                .where(other.url == update_data["url"], other.id != feed_id)
+                .exists()
+            )
+        db_feed = db.execute(
+            stmt.values(**update_data).returning(FeedConfiguration)
+        ).scalar_one_or_none()
+    else:
+        db_feed = db.query(FeedConfiguration).filter(FeedConfiguration.id == feed_id).first()
 
-    for key, value in update_data.items():
-        setattr(db_feed, key, value)
+    if not db_feed:
+        # Nothing updated: a missing feed is a 404, otherwise the URL conflicted
+        exists = db.query(FeedConfiguration.id).filter(FeedConfiguration.id == feed_id).first()
+        if not exists:
+            raise HTTPException(status_code=404, detail=f"Feed {feed_id} not found")
+        raise HTTPException(status_code=400, detail="Feed URL already exists")
 
+    # Serialize before commit expires the instance
+    result = FeedConfigurationResponse.model_validate(db_feed, from_attributes=True)
     db.commit()
-    db.refresh(db_feed)
 
-    logger.info(f"Updated feed: {db_feed.name} ({db_feed.id})")
-    return db_feed
+    logger.info(f"Updated feed: {result.name} ({result.id})")
+    return result
 
 
 @router.delete("/feeds/{feed_id}")
@@ -599,8 +776,6 @@ def delete_feed(feed_id: int, db: Session = Depends(get_db), auth: str = Depends
 @router.post("/feeds/import-defaults")
 def import_default_feeds(db: Session = Depends(get_db), auth: str = Depends(require_auth)):
     """Import default feeds from config into database."""
-    from .config import settings
-
     feed_urls = settings.get_feed_list()
     imported = 0
     skipped = 0
@@ -648,7 +823,9 @@ def get_admin_stats(db: Session = Depends(get_db)):
 
     # Story statistics
     total_stories = service.get_story_count()
-    latest_story = service.get_latest_story()
+    first_story_at, latest_story_at = db.query(
+        func.min(StoryVersion.created_at), func.max(StoryVersion.created_at)
+    ).one()
 
     # Time-based story stats
     now = datetime.now(timezone.utc)
@@ -700,8 +877,7 @@ def get_admin_stats(db: Session = Depends(get_db)):
 
     # Recent story generation rate
     if total_stories > 1:
-        first_story = db.query(StoryVersion).order_by(StoryVersion.created_at.asc()).first()
-        time_span = (latest_story.created_at - first_story.created_at).total_seconds()
+        time_span = (latest_story_at - first_story_at).total_seconds()
         stories_per_hour = (total_stories / time_span) * 3600 if time_span > 0 else 0
     else:
         stories_per_hour = 0
@@ -713,7 +889,7 @@ def get_admin_stats(db: Session = Depends(get_db)):
             "this_week": stories_this_week,
             "this_month": stories_this_month,
             "per_hour": round(stories_per_hour, 2),
-            "latest_at": latest_story.created_at.isoformat() if latest_story else None,
+            "latest_at": latest_story_at.isoformat() if latest_story_at else None,
             "avg_length": int(avg_story_length)
         },
         "feeds": {
@@ -776,11 +952,23 @@ def get_images(
 
 
 @router.get("/images/{image_id}", response_model=GeneratedImageResponse)
-def get_image_by_id(image_id: int, db: Session = Depends(get_db)):
+def get_image_by_id(
+    image_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get a specific generated image by ID."""
     image = db.query(GeneratedImage).filter(GeneratedImage.id == image_id).first()
     if not image:
         raise HTTPException(status_code=404, detail=f"Image {image_id} not found")
+
+    not_modified = _conditional_response(
+        request, response, _immutable_etag("image", image.id, image.created_at)
+    )
+    if not_modified:
+        return not_modified
+
     return image
 
 
@@ -802,17 +990,22 @@ def get_image_by_story(story_id: int, db: Session = Depends(get_db)):
 @router.get("/stats", response_model=StatsResponse)
 def get_stats(db: Session = Depends(get_db)):
     """Get public statistics about the service."""
-    # Total counts
-    total_stories = db.query(func.count(StoryVersion.id)).scalar()
-    total_images = db.query(func.count(GeneratedImage.id)).scalar()
+    with _stats_cache_lock:
+        cached = _stats_cache.get("stats")
+    if cached is not None:
+        return cached
+
+    # Total counts and latest timestamps, one scan per table
+    total_stories, latest_story_at = db.query(
+        func.count(StoryVersion.id), func.max(StoryVersion.created_at)
+    ).one()
+    total_images, latest_image_at = db.query(
+        func.count(GeneratedImage.id), func.max(GeneratedImage.created_at)
+    ).one()
     total_feed_items = db.query(func.count(FeedItem.id)).scalar()
 
-    # Latest timestamps
-    latest_story = db.query(StoryVersion).order_by(StoryVersion.created_at.desc()).first()
-    latest_image = db.query(GeneratedImage).order_by(GeneratedImage.created_at.desc()).first()
-
     # Last 24 hours counts
-    twenty_four_hours_ago = datetime.now() - timedelta(hours=24)
+    twenty_four_hours_ago = datetime.now(timezone.utc) - timedelta(hours=24)
     stories_last_24h = (
         db.query(func.count(StoryVersion.id))
         .filter(StoryVersion.created_at >= twenty_four_hours_ago)
@@ -825,14 +1018,14 @@ def get_stats(db: Session = Depends(get_db)):
     )
 
     # Uptime
-    uptime_hours = (datetime.now() - _app_start_time).total_seconds() / 3600
+    uptime_hours = (time.monotonic() - _app_start_monotonic) / 3600
 
-    return StatsResponse(
+    stats = StatsResponse(
         total_stories=total_stories,
         total_images=total_images,
         total_feed_items=total_feed_items,
-        latest_story_at=latest_story.created_at if latest_story else None,
-        latest_image_at=latest_image.created_at if latest_image else None,
+        latest_story_at=latest_story_at,
+        latest_image_at=latest_image_at,
         update_frequency_minutes=settings.singl_update_minutes,
         feeds_count=len(settings.get_feed_list()),
         model_name=settings.singl_model_name,
@@ -841,6 +1034,11 @@ def get_stats(db: Session = Depends(get_db)):
         images_last_24h=images_last_24h,
     )
 
+    with _stats_cache_lock:
+        _stats_cache["stats"] = stats
+
+    return stats
+
 
 # ============================================================================
 # Control Panel Endpoints (Protected)
@@ -849,7 +1047,9 @@ def get_stats(db: Session = Depends(get_db)):
 @router.post("/control-panel/auth", response_model=ControlPanelAuthResponse)
 def authenticate_control_panel(auth_request: ControlPanelAuthRequest):
     """Authenticate for control panel access."""
-    if auth_request.password == settings.singl_admin_password:
+    # Constant-time comparison so response timing doesn't leak the password
+    submitted = auth_request.password.encode("utf-8", "replace")
+    if hmac.compare_digest(submitted, settings.admin_password_bytes):
         token = create_auth_token()
         return ControlPanelAuthResponse(
             success=True,
@@ -863,18 +1063,29 @@ def authenticate_control_panel(auth_request: ControlPanelAuthRequest):
         )
 
 
-@router.get("/control-panel/config", response_model=ConfigResponse)
+# Trusted server-built data: skip response validation, keep the schema in OpenAPI
+@router.get(
+    "/control-panel/config",
+    response_model=None,
+    responses={200: {"model": ConfigResponse}},
+)
 def get_config(
     authenticated: bool = Depends(verify_auth_token),
     db: Session = Depends(get_db)
-):
+) -> ConfigResponse:
     """Get current configuration (requires authentication)."""
+    with _config_cache_lock:
+        cached = _config_response_cache.get("config")
+        generation = _config_cache_generation
+    if cached is not None:
+        return cached
+
     # Load from database if available, otherwise use env defaults
     def get_setting(key: str, default):
         setting = db.query(UserSettings).filter(UserSettings.key == f"config_{key}").first()
         return setting.value if setting else default
 
-    return ConfigResponse(
+    config = ConfigResponse(
         singl_model_name=get_setting("model_name", settings.singl_model_name),
         singl_update_minutes=get_setting("update_minutes", settings.singl_update_minutes),
         singl_context_steps=get_setting("context_steps", settings.singl_context_steps),
@@ -888,14 +1099,26 @@ def get_config(
         feed_count=len(settings.get_feed_list()),
     )
 
+    # An update that landed while we were reading may have made this stale
+    with _config_cache_lock:
+        if generation == _config_cache_generation:
+            _config_response_cache["config"] = config
+
+    return config
 
-@router.post("/control-panel/config", response_model=ConfigResponse)
+
+@router.post(
+    "/control-panel/config",
+    response_model=None,
+    responses={200: {"model": ConfigResponse}},
+)
 def update_config(
     config_update: ConfigUpdateRequest,
     authenticated: bool = Depends(verify_auth_token),
     db: Session = Depends(get_db)
-):
+) -> ConfigResponse:
     """Update configuration (requires authentication). Settings are persisted to database."""
+    global _config_cache_generation
 
     def save_setting(key: str, value):
         """Save or update a setting in the database and update in-memory settings."""
@@ -906,53 +1129,19 @@ def update_config(
             setting = UserSettings(key=f"config_{key}", value=value)
             db.add(setting)
 
-    # Update settings and persist to database
-    if config_update.singl_model_name is not None:
-        save_setting("model_name", config_update.singl_model_name)
-        settings.singl_model_name = config_update.singl_model_name
-
-    if config_update.singl_update_minutes is not None:
-        save_setting("update_minutes", config_update.singl_update_minutes)
-        settings.singl_update_minutes = config_update.singl_update_minutes
-
-    if config_update.singl_context_steps is not None:
-        save_setting("context_steps", config_update.singl_context_steps)
-        settings.singl_context_steps = config_update.singl_context_steps
-
-    if config_update.singl_temperature is not None:
-        save_setting("temperature", config_update.singl_temperature)
-        settings.singl_temperature = config_update.singl_temperature
-
-    if config_update.singl_max_tokens is not None:
-        save_setting("max_tokens", config_update.singl_max_tokens)
-        settings.singl_max_tokens = config_update.singl_max_tokens
-
-    if config_update.singl_image_generation_enabled is not None:
-        save_setting("image_generation_enabled", config_update.singl_image_generation_enabled)
-        settings.singl_image_generation_enabled = config_update.singl_image_generation_enabled
-
-    if config_update.singl_image_generation_interval is not None:
-        save_setting("image_generation_interval", config_update.singl_image_generation_interval)
-        settings.singl_image_generation_interval = config_update.singl_image_generation_interval
-
-    if config_update.singl_image_model is not None:
-        save_setting("image_model", config_update.singl_image_model)
-        settings.singl_image_model = config_update.singl_image_model
-
-    if config_update.singl_image_size is not None:
-        save_setting("image_size", config_update.singl_image_size)
-        settings.singl_image_size = config_update.singl_image_size
-
-    if config_update.singl_image_quality is not None:
-        save_setting("image_quality", config_update.singl_image_quality)
-        settings.singl_image_quality = config_update.singl_image_quality
-
-    if config_update.singl_feeds is not None:
-        save_setting("feeds", config_update.singl_feeds)
-        settings.singl_feeds = config_update.singl_feeds
+    # Update settings and persist to database; DB keys drop the "singl_" prefix
+    updates = config_update.model_dump(exclude_unset=True, exclude_none=True)
+    for field, value in updates.items():
+        if field not in _UPDATABLE_CONFIG_FIELDS:
+            continue
+        save_setting(field.removeprefix("singl_"), value)
+        setattr(settings, field, value)
 
     # Commit all changes to database
     db.commit()
+    with _config_cache_lock:
+        _config_cache_generation += 1
+        _config_response_cache.clear()
 
     logger.info("Configuration updated and persisted to database via control panel")
 
@@ -972,7 +1161,7 @@ def update_config(
 
 
 @router.get("/settings", response_model=UserSettingsResponse)
-async def get_user_settings(db: Session = Depends(get_db)):
+def get_user_settings(db: Session = Depends(get_db)):
     """Get user settings (theme preferences, etc.)."""
     theme_setting = db.query(UserSettings).filter(UserSettings.key == "theme").first()
 
@@ -983,7 +1172,7 @@ async def get_user_settings(db: Session = Depends(get_db)):
 
 
 @router.post("/settings", response_model=UserSettingsResponse)
-async def update_user_settings(
+def update_user_settings(
     settings_update: UserSettingsUpdate,
     db: Session = Depends(get_db)
 ):
@@ -1015,21 +1204,8 @@ async def update_user_settings(
 # Analytics Endpoints
 # ============================================================================
 
-@router.get("/story/{story_id}/analytics", response_model=StoryAnalyticsResponse)
-def get_story_analytics(story_id: int, db: Session = Depends(get_db)):
-    """
-    Get comprehensive analytics for a story including sentiment, bias, fact-checks, and predictions.
-
-    Args:
-        story_id: Story version ID
-    """
-    service = AnalyticsService(db)
-    analytics = service.get_analytics(story_id)
-
-    if not analytics:
-        raise HTTPException(status_code=404, detail=f"Analytics not available for story {story_id}")
-
-    # Convert to response format
+def _analytics_response(analytics: StoryAnalytics) -> StoryAnalyticsResponse:
+    """Convert a StoryAnalytics row to its response schema."""
     response_data = {
         "story_version_id": analytics.story_version_id,
         "created_at": analytics.created_at,
@@ -1046,6 +1222,23 @@ def get_story_analytics(story_id: int, db: Session = Depends(get_db)):
     return StoryAnalyticsResponse(**response_data)
 
 
+@router.get("/story/{story_id}/analytics", response_model=StoryAnalyticsResponse)
+def get_story_analytics(story_id: int, db: Session = Depends(get_db)):
+    """
+    Get comprehensive analytics for a story including sentiment, bias, fact-checks, and predictions.
+
+    Args:
+        story_id: Story version ID
+    """
+    service = AnalyticsService(db)
+    analytics = service.get_analytics(story_id)
+
+    if not analytics:
+        raise HTTPException(status_code=404, detail=f"Analytics not available for story {story_id}")
+
+    return _analytics_response(analytics)
+
+
 @router.get("/analytics/timeline")
 def get_timeline_events(limit: int = 50, db: Session = Depends(get_db)):
     """
@@ -1096,18 +1289,4 @@ def get_current_story_analytics(db: Session = Depends(get_db)):
     if not analytics:
         raise HTTPException(status_code=404, detail="Analytics not available for current story")
 
-    # Convert to response format
-    response_data = {
-        "story_version_id": analytics.story_version_id,
-        "created_at": analytics.created_at,
-        "overall_sentiment": analytics.overall_sentiment,
-        "sentiment_score": SentimentScore(**analytics.sentiment_score) if analytics.sentiment_score else None,
-        "bias_score": BiasScore(**analytics.bias_score) if analytics.bias_score else None,
-        "bias_indicators": analytics.bias_indicators,
-        "source_analysis": [SourceAnalysis(**s) for s in analytics.source_analysis] if analytics.source_analysis else None,
-        "fact_checks": [FactCheck(**f) for f in analytics.fact_checks] if analytics.fact_checks else None,
-        "predictions": [Prediction(**p) for p in analytics.predictions] if analytics.predictions else None,
-        "events": [EventData(**e) for e in analytics.events] if analytics.events else None,
-    }
-
-    return StoryAnalyticsResponse(**response_data)
+    return _analytics_response(analytics)
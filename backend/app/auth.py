@@ -1,26 +1,60 @@
 """Authentication and authorization."""
 import os
 import secrets
+import threading
 from typing import Optional
 from fastapi import HTTPException, Security, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from datetime import datetime, timedelta
 import hashlib
 import hmac
+import logging
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
-# Admin API key from environment
-ADMIN_API_KEY = os.getenv('SINGL_ADMIN_API_KEY', None)
+# Shared by every 401 raised here; never mutated
+_WWW_AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
 
-# If no API key is set, generate one on startup
-if not ADMIN_API_KEY:
-    ADMIN_API_KEY = secrets.token_urlsafe(32)
-    print(f"\n{'='*80}")
-    print(f"⚠️  NO ADMIN API KEY SET! Generated temporary key:")
-    print(f"   {ADMIN_API_KEY}")
-    print(f"   Set SINGL_ADMIN_API_KEY environment variable for persistence.")
-    print(f"{'='*80}\n")
+# Admin API key from environment; if unset, a temporary key is generated on
+# first use (see _ensure_admin_key) so importing this module has no side effects
+ADMIN_API_KEY = os.getenv('SINGL_ADMIN_API_KEY', None)
+_admin_key_lock = threading.Lock()
+
+# ADMIN_API_KEY encoded once for constant-time byte comparisons
+_ADMIN_API_KEY_BYTES: Optional[bytes] = None
+
+# Seconds to remember verification results (0 disables the cache)
+AUTH_CACHE_TTL = int(os.getenv('SINGL_AUTH_CACHE_TTL', '30'))
+
+# Keyed by SHA-256 digest so raw tokens are never retained in memory
+_token_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=10000, ttl=AUTH_CACHE_TTL) if AUTH_CACHE_TTL > 0 else None
+)
+_token_cache_lock = threading.Lock()
+
+
+def _ensure_admin_key() -> str:
+    """Return the admin API key, generating a temporary one on first use."""
+    global ADMIN_API_KEY, _ADMIN_API_KEY_BYTES
+    if _ADMIN_API_KEY_BYTES is not None:
+        return ADMIN_API_KEY
+
+    with _admin_key_lock:
+        if not ADMIN_API_KEY:
+            ADMIN_API_KEY = secrets.token_urlsafe(32)
+            logger.warning(
+                "\n%s\n⚠️  NO ADMIN API KEY SET! Generated temporary key:\n   %s\n"
+                "   Set SINGL_ADMIN_API_KEY environment variable for persistence.\n%s",
+                "=" * 80,
+                ADMIN_API_KEY,
+                "=" * 80,
+            )
+        _ADMIN_API_KEY_BYTES = ADMIN_API_KEY.encode("utf-8")
+    return ADMIN_API_KEY
 
 
 def verify_api_key(api_key: str) -> bool:
@@ -33,11 +67,26 @@ def verify_api_key(api_key: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not ADMIN_API_KEY:
-        return False
+    _ensure_admin_key()
+
+    # Compare bytes: avoids compare_digest's str path, which also raises
+    # TypeError on non-ASCII input instead of simply failing
+    api_key_bytes = api_key.encode("utf-8")
+
+    if _token_cache is None:
+        return hmac.compare_digest(api_key_bytes, _ADMIN_API_KEY_BYTES)
+
+    key = hashlib.sha256(api_key_bytes).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        return cached
 
     # Use constant-time comparison to prevent timing attacks
-    return hmac.compare_digest(api_key, ADMIN_API_KEY)
+    valid = hmac.compare_digest(api_key_bytes, _ADMIN_API_KEY_BYTES)
+    with _token_cache_lock:
+        _token_cache[key] = valid
+    return valid
 
 
 async def require_auth(
@@ -59,16 +108,17 @@ async def require_auth(
         raise HTTPException(
             status_code=401,
             detail="Missing authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_WWW_AUTH_HEADERS,
         )
 
     api_key = credentials.credentials
 
-    if not verify_api_key(api_key):
+    # Verification runs off the event loop so slower checks never stall it
+    if not await run_in_threadpool(verify_api_key, api_key):
         raise HTTPException(
             status_code=401,
             detail="Invalid API key",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_WWW_AUTH_HEADERS,
         )
 
     return api_key
@@ -91,7 +141,7 @@ async def optional_auth(
 
     api_key = credentials.credentials
 
-    if verify_api_key(api_key):
+    if await run_in_threadpool(verify_api_key, api_key):
         return api_key
 
     return None
@@ -99,4 +149,4 @@ async def optional_auth(
 
 def get_admin_api_key() -> str:
     """Get the current admin API key."""
-    return ADMIN_API_KEY
+    return _ensure_admin_key()
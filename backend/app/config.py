@@ -1,7 +1,9 @@
 """Configuration management for UnioNews backend."""
 import os
+from functools import cached_property
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Optional, Tuple
 
 
 class Settings(BaseSettings):
@@ -13,9 +15,12 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str
     singl_model_name: str = "gpt-4-turbo-preview"
+    singl_openai_max_concurrency: int = 8
 
     # Scheduler
+    singl_scheduler_enabled: bool = True
     singl_update_minutes: int = 30
+    singl_force_regen_minutes: int = 180
     singl_context_steps: int = 10
 
     # RSS Feeds - diverse sources for erratic story generation
@@ -90,6 +95,9 @@ class Settings(BaseSettings):
     # App
     app_name: str = "UnioNews Backend"
 
+    # Parsed feed URLs paired with the singl_feeds string they were parsed from
+    _feed_list_cache: Optional[Tuple[str, Tuple[str, ...]]] = PrivateAttr(default=None)
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -97,22 +105,24 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    def get_feed_list(self) -> List[str]:
-        """Parse comma-separated feed URLs into a list."""
-        return [feed.strip() for feed in self.singl_feeds.split(",") if feed.strip()]
+    @cached_property
+    def admin_password_bytes(self) -> bytes:
+        """Admin password encoded once for constant-time comparisons."""
+        return self.singl_admin_password.encode("utf-8")
+
+    def get_feed_list(self) -> Tuple[str, ...]:
+        """
+        Parse comma-separated feed URLs into an immutable tuple.
+
+        The parsed tuple is cached and shared until singl_feeds is reassigned
+        (e.g. via the control panel).
+        """
+        cache = self._feed_list_cache
+        if cache is None or cache[0] is not self.singl_feeds:
+            feeds = tuple(feed.strip() for feed in self.singl_feeds.split(",") if feed.strip())
+            cache = self._feed_list_cache = (self.singl_feeds, feeds)
+        return cache[1]
 
 
 # Global settings instance
 settings = Settings()
-
-# Debug logging for configuration (only shows on startup)
-print("=" * 80)
-print("🔧 UNIONEWS CONFIGURATION LOADED")
-print("=" * 80)
-print(f"📊 Database: {settings.database_url.split('@')[1] if '@' in settings.database_url else 'configured'}")
-print(f"🤖 OpenAI Key: {'✓ SET (' + settings.openai_api_key[-4:] + ')' if settings.openai_api_key else '✗ NOT SET'}")
-print(f"🎨 Model: {settings.singl_model_name}")
-print(f"⏱️  Update Interval: {settings.singl_update_minutes} minutes")
-print(f"🔐 Admin Password: {'✓ SET' if settings.singl_admin_password else '✗ NOT SET'}")
-print(f"📡 Active Feeds: {len(settings.get_feed_list())}")
-print("=" * 80)
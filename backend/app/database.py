@@ -1,19 +1,39 @@
 """Database setup and session management."""
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from .config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
+
+def _json_default(value):
+    """Encode tuple subclasses (e.g. time.struct_time) as lists, as json.dumps does."""
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _json_serializer(value) -> str:
+    """Encode JSON column values with orjson (accepts non-string dict keys like json.dumps)."""
+    return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_ENGINE_OPTIONS = dict(
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
-# Session factory
+# Create SQLAlchemy engine
+engine = create_engine(settings.database_url, pool_size=10, max_overflow=20, **_ENGINE_OPTIONS)
+
+# Separate small pool for the background update job, so its long-lived
+# sessions never take connections from API requests
+scheduler_engine = create_engine(settings.database_url, pool_size=2, max_overflow=0, **_ENGINE_OPTIONS)
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SchedulerSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=scheduler_engine)
 
 # Base class for models
 Base = declarative_base()
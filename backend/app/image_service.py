@@ -1,13 +1,66 @@
 """Quote card image generation service."""
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
-from typing import Tuple
+from typing import Optional, Tuple
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Supported output formats: name -> (media type, Pillow save options).
+# PNG is lossless, so favour fast encoding; WebP trades a little CPU for
+# noticeably smaller cards.
+IMAGE_FORMATS = {
+    "png": ("image/png", {"format": "PNG", "compress_level": 1}),
+    "webp": ("image/webp", {"format": "WEBP", "quality": 90, "method": 4}),
+}
+
+# (bold, regular) font candidates, in order of preference
+FONT_PATHS = [
+    # Debian/Ubuntu paths
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf"),
+    # Alpine paths
+    ("/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf", "/usr/share/fonts/dejavu/DejaVuSerif.ttf"),
+    # Fallback to sans for both
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"),
+]
+
+
+@lru_cache(maxsize=64)
+def _load_font(size: int, bold: bool):
+    """
+    Load and cache the first usable font so each weight/size is parsed only once.
+
+    A missing, corrupt or unreadable font file falls through to the next candidate.
+    """
+    for bold_path, regular_path in FONT_PATHS:
+        try:
+            path = bold_path if bold else regular_path
+            return ImageFont.truetype(path, size)
+        except (OSError, IOError):
+            continue
+
+    # Fall back to default font if nothing works
+    try:
+        return ImageFont.load_default()
+    except:
+        # Ultimate fallback - use basic PIL font
+        return None
 
 
 class QuoteImageGenerator:
     """Generates shareable quote card images."""
 
+    # Static layer shared by every card rendered in this process
+    _template: Optional[Image.Image] = None
+
     def __init__(self):
         self.width = 1200
         self.height = 630  # Twitter/Facebook optimal size
@@ -16,30 +69,46 @@ class QuoteImageGenerator:
         self.accent_color = '#ff4444'
         self.border_color = '#666666'
 
+    def _get_template(self) -> Image.Image:
+        """
+        Get the static card layer (background, border and branding).
+
+        Built once per process; callers must copy() before drawing on it.
+        """
+        template = QuoteImageGenerator._template
+        if template is None:
+            template = Image.new('RGB', (self.width, self.height), self.bg_color)
+            draw = ImageDraw.Draw(template)
+
+            # Add border
+            border_width = 8
+            draw.rectangle(
+                [(border_width, border_width),
+                 (self.width - border_width, self.height - border_width)],
+                outline=self.border_color,
+                width=border_width
+            )
+
+            # Add branding at top
+            brand_font = self._get_font(36, bold=True)
+            brand_text = "THE STORY - UnioNews"
+            bbox = brand_font.getbbox(brand_text)
+            brand_width = bbox[2] - bbox[0]
+            brand_x = (self.width - brand_width) // 2
+
+            draw.text(
+                (brand_x, 50),
+                brand_text,
+                fill=self.text_color,
+                font=brand_font
+            )
+
+            QuoteImageGenerator._template = template
+        return template
+
     def _get_font(self, size: int, bold: bool = False):
         """Get font, falling back to default if custom fonts unavailable."""
-        font_paths = [
-            # Debian/Ubuntu paths
-            ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf"),
-            # Alpine paths
-            ("/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf", "/usr/share/fonts/dejavu/DejaVuSerif.ttf"),
-            # Fallback to sans for both
-            ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"),
-        ]
-
-        for bold_path, regular_path in font_paths:
-            try:
-                path = bold_path if bold else regular_path
-                return ImageFont.truetype(path, size)
-            except (OSError, IOError):
-                continue
-
-        # Fall back to default font if nothing works
-        try:
-            return ImageFont.load_default()
-        except:
-            # Ultimate fallback - use basic PIL font
-            return None
+        return _load_font(size, bold)
 
     def _wrap_text(self, text: str, font, max_width: int) -> list:
         """Wrap text to fit within max width."""
@@ -64,21 +133,29 @@ class QuoteImageGenerator:
         lines = []
         current_line = []
 
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            try:
-                bbox = font.getbbox(test_line)
-                width = bbox[2] - bbox[0]
-            except:
-                # If font doesn't support getbbox, estimate
-                width = len(test_line) * (font.size * 0.6 if hasattr(font, 'size') else 10)
+        # Measure each word once and accumulate, rather than re-measuring
+        # the whole candidate line for every word
+        try:
+            word_widths = [font.getlength(word) for word in words]
+            space_width = font.getlength(' ')
+        except Exception:
+            # If font doesn't support getlength, estimate
+            char_width = font.size * 0.6 if hasattr(font, 'size') else 10
+            word_widths = [len(word) * char_width for word in words]
+            space_width = char_width
+
+        line_width = 0.0
+        for word, word_width in zip(words, word_widths):
+            width = line_width + space_width + word_width if current_line else word_width
 
             if width <= max_width:
                 current_line.append(word)
+                line_width = width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                 current_line = [word]
+                line_width = word_width
 
         if current_line:
             lines.append(' '.join(current_line))
@@ -89,7 +166,8 @@ class QuoteImageGenerator:
         self,
         quote_text: str,
         category: str,
-        absurdity_score: int
+        absurdity_score: int,
+        image_format: str = "png",
     ) -> BytesIO:
         """
         Generate a shareable quote card image.
@@ -98,27 +176,18 @@ class QuoteImageGenerator:
             quote_text: The quote text
             category: Quote category
             absurdity_score: Absurdity score 1-10
+            image_format: Output format, a key of IMAGE_FORMATS
 
         Returns:
-            BytesIO object containing PNG image data
+            BytesIO object containing the encoded image data
         """
-        # Create image with background
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        # Start from the pre-rendered background, border and branding
+        img = self._get_template().copy()
         draw = ImageDraw.Draw(img)
 
-        # Add border
-        border_width = 8
-        draw.rectangle(
-            [(border_width, border_width),
-             (self.width - border_width, self.height - border_width)],
-            outline=self.border_color,
-            width=border_width
-        )
-
         # Fonts
         quote_font = self._get_font(48, bold=False)
         meta_font = self._get_font(32, bold=True)
-        brand_font = self._get_font(36, bold=True)
 
         # Wrap quote text
         padding = 100
@@ -207,22 +276,91 @@ class QuoteImageGenerator:
             font=meta_font
         )
 
-        # Add branding at top
-        brand_text = "THE STORY - UnioNews"
-        bbox = brand_font.getbbox(brand_text)
-        brand_width = bbox[2] - bbox[0]
-        brand_x = (self.width - brand_width) // 2
-
-        draw.text(
-            (brand_x, 50),
-            brand_text,
-            fill=self.text_color,
-            font=brand_font
-        )
-
         # Convert to bytes
         output = BytesIO()
-        img.save(output, format='PNG', quality=95)
+        img.save(output, **IMAGE_FORMATS[image_format][1])
         output.seek(0)
 
         return output
+
+
+# Persistent worker processes for CPU-bound card rendering, created on first use
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+# Rendered image bytes keyed by a digest of the card inputs; repeat share-link
+# hits for the same quote skip rendering entirely
+_rendered_cache: LRUCache = LRUCache(maxsize=512)
+_rendered_cache_lock = threading.Lock()
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Get or create the shared rendering process pool."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            # spawn avoids forking a process that already runs threads (uvicorn, APScheduler)
+            _render_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("Started quote card render pool")
+        return _render_pool
+
+
+def _render_quote_image(quote_text: str, category: str, absurdity_score: int, image_format: str) -> bytes:
+    """Render a quote card to encoded bytes (runs inside a pool worker)."""
+    generator = QuoteImageGenerator()
+    return generator.generate_quote_image(
+        quote_text, category, absurdity_score, image_format
+    ).getvalue()
+
+
+def render_quote_image(
+    quote_text: str,
+    category: str,
+    absurdity_score: int,
+    image_format: str = "png",
+) -> BytesIO:
+    """
+    Render a quote card in the shared worker pool.
+
+    Rendering is CPU-bound and holds the GIL, so running it in separate
+    processes lets concurrent requests use multiple cores. Results are
+    cached by input so identical cards are only rendered once.
+
+    Returns:
+        BytesIO object containing the encoded image data
+
+    Raises:
+        ValueError: If image_format is not a key of IMAGE_FORMATS
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+
+    key = hashlib.sha256(
+        f"{quote_text}\x00{category}\x00{absurdity_score}\x00{image_format}".encode("utf-8")
+    ).digest()
+
+    with _rendered_cache_lock:
+        data = _rendered_cache.get(key)
+
+    if data is None:
+        future = _get_render_pool().submit(
+            _render_quote_image, quote_text, category, absurdity_score, image_format
+        )
+        data = future.result()
+        with _rendered_cache_lock:
+            _rendered_cache[key] = data
+
+    # Fresh BytesIO per caller so each response gets its own read position
+    return BytesIO(data)
+
+
+def shutdown_render_pool():
+    """Shut down the rendering process pool if it was started."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(wait=True)
+            _render_pool = None
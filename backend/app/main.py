@@ -9,6 +9,7 @@ from .api import router as api_router
 from .ws import websocket_endpoint
 from .scheduler import get_scheduler
 from .database import init_db
+from .image_service import shutdown_render_pool
 
 # Configure logging
 logging.basicConfig(
@@ -19,31 +20,56 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def log_configuration():
+    """Log a summary of the loaded configuration (secrets redacted)."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    rule = "=" * 80
+    _, sep, db_host = settings.database_url.rpartition('@')
+    logger.info(
+        "\n%s\n🔧 UNIONEWS CONFIGURATION LOADED\n%s\n"
+        "📊 Database: %s\n"
+        "🤖 OpenAI Key: %s\n"
+        "🎨 Model: %s\n"
+        "⏱️  Update Interval: %s minutes\n"
+        "🔐 Admin Password: %s\n"
+        "📡 Active Feeds: %s\n%s",
+        rule,
+        rule,
+        db_host if sep else 'configured',
+        f"✓ SET ({settings.openai_api_key[-4:]})" if settings.openai_api_key else "✗ NOT SET",
+        settings.singl_model_name,
+        settings.singl_update_minutes,
+        "✓ SET" if settings.singl_admin_password else "✗ NOT SET",
+        len(settings.get_feed_list()),
+        rule,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
     """
-    # Startup
-    logger.info("Starting UnioNews Backend")
-
-    # Initialize database
-    logger.info("Initializing database")
+    # Startup: configuration summary, database tables, story scheduler
+    log_configuration()
     init_db()
-
-    # Start scheduler
-    logger.info("Starting story update scheduler")
     scheduler = get_scheduler()
-    scheduler.start()
-
-    logger.info("UnioNews Backend started successfully")
+    if scheduler.start():
+        logger.info(
+            "UnioNews Backend started: database initialized, scheduler running every %s minutes",
+            settings.singl_update_minutes,
+        )
+    else:
+        logger.info("UnioNews Backend started: database initialized, scheduler not running here")
 
     yield
 
     # Shutdown
-    logger.info("Shutting down UnioNews Backend")
     scheduler.shutdown()
-    logger.info("Shutdown complete")
+    shutdown_render_pool()
+    logger.info("UnioNews Backend shutdown complete: scheduler and render pool stopped")
 
 
 # Create FastAPI app
@@ -54,13 +80,24 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Configure CORS
+# Configure CORS from the comma-separated SINGL_WS_ORIGIN, parsed once.
+# The wildcard is served without credentials: with credentials Starlette
+# has to echo each request's Origin back, and the API authenticates with
+# bearer headers rather than cookies anyway. Explicit origins keep
+# credentials enabled.
+CORS_ORIGINS = tuple(
+    origin.strip() for origin in settings.singl_ws_origin.split(",") if origin.strip()
+)
+CORS_ALLOW_ALL = "*" in CORS_ORIGINS
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"] if settings.singl_ws_origin == "*" else [settings.singl_ws_origin],
-    allow_credentials=True,
+    allow_origins=["*"] if CORS_ALLOW_ALL else CORS_ORIGINS,
+    allow_credentials=not CORS_ALLOW_ALL,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Paginated endpoints carry their next-page cursor in Link
+    expose_headers=["Link"],
 )
 
 # Include routers
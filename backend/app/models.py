@@ -1,9 +1,14 @@
 """SQLAlchemy database models."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, ForeignKey, Index, LargeBinary, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 from .database import Base
 
+# Binary JSON on PostgreSQL (indexable, no reparsing on read); plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class StoryVersion(Base):
     """Represents a version of the single, evolving story."""
@@ -15,8 +20,24 @@ class StoryVersion(Base):
     full_text = Column(Text, nullable=False)
     summary = Column(Text, nullable=False)
     context_summary = Column(Text)  # Compressed narrative context for future generations
-    sources_snapshot = Column(JSON)  # Which feeds/items influenced this version
-    token_stats = Column(JSON)  # OpenAI usage statistics
+    sources_snapshot = Column(JSONType)  # Which feeds/items influenced this version
+    token_stats = Column(JSONType)  # OpenAI usage statistics
+
+    # Generated image for this version, if any (eager-load with selectinload)
+    image = relationship(
+        "GeneratedImage",
+        primaryjoin="StoryVersion.id == foreign(GeneratedImage.story_version_id)",
+        uselist=False,
+        viewonly=True,
+    )
+
+    # Analytics for this version, if generated (eager-load with selectinload)
+    analytics = relationship(
+        "StoryAnalytics",
+        primaryjoin="StoryVersion.id == foreign(StoryAnalytics.story_version_id)",
+        uselist=False,
+        viewonly=True,
+    )
 
     def __repr__(self):
         return f"<StoryVersion(id={self.id}, created_at={self.created_at})>"
@@ -35,11 +56,18 @@ class FeedItem(Base):
     link = Column(String, nullable=False)
     published_at = Column(DateTime(timezone=True), index=True)
     fetched_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    content_hash = Column(String, nullable=False, unique=True)  # For deduplication
-    raw = Column(JSON)  # Raw feed item data
+    content_hash = Column(LargeBinary(16), nullable=False, unique=True)  # BLAKE2b-128 digest for deduplication
+    raw = Column(JSONType)  # Raw feed item data
 
     __table_args__ = (
         UniqueConstraint('link', 'title', name='uix_link_title'),
+        # Rows arrive in fetch order, so a tiny block-range index serves the time-window counts
+        Index(
+            "ix_feed_items_fetched_at_brin",
+            "fetched_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
@@ -61,8 +89,19 @@ class FeedConfiguration(Base):
     fetch_error = Column(Text)  # Store last error if any
     priority = Column(Integer, default=0)  # Higher priority feeds checked first
 
+    __table_args__ = (
+        # Ingestion reads active feeds by priority; inactive rows stay out of the index
+        Index(
+            "ix_feed_configurations_active_priority",
+            priority.desc(),
+            postgresql_where=text("is_active"),
+        ),
+    )
+
     def __repr__(self):
         return f"<FeedConfiguration(id={self.id}, name='{self.name}', active={self.is_active})>"
+
+
 class GeneratedImage(Base):
     """Represents an AI-generated image inspired by the news story."""
 
@@ -70,7 +109,9 @@ class GeneratedImage(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
-    story_version_id = Column(Integer, nullable=False, index=True)  # Associated story version
+    story_version_id = Column(
+        Integer, ForeignKey("story_versions.id", ondelete="CASCADE"), nullable=False
+    )  # Associated story version
     prompt = Column(Text, nullable=False)  # The prompt used to generate the image
     image_url = Column(String, nullable=False)  # OpenAI image URL
     revised_prompt = Column(Text)  # OpenAI's revised prompt (if available)
@@ -78,6 +119,11 @@ class GeneratedImage(Base):
     size = Column(String, nullable=False)  # Image size (e.g., 1024x1024)
     quality = Column(String, nullable=False)  # Quality setting (standard/hd)
 
+    __table_args__ = (
+        # Covers per-story lookups and "latest image for story" without a sort
+        Index("ix_generated_images_story_created", "story_version_id", "created_at"),
+    )
+
     def __repr__(self):
         return f"<GeneratedImage(id={self.id}, story_version_id={self.story_version_id})>"
 
@@ -103,28 +149,39 @@ class StoryAnalytics(Base):
     __tablename__ = "story_analytics"
 
     id = Column(Integer, primary_key=True, index=True)
-    story_version_id = Column(Integer, nullable=False, index=True, unique=True)
+    story_version_id = Column(
+        Integer, ForeignKey("story_versions.id", ondelete="CASCADE"), nullable=False, index=True, unique=True
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Sentiment analysis
     overall_sentiment = Column(String, nullable=True)  # positive, negative, neutral
-    sentiment_score = Column(JSON, nullable=True)  # {positive: 0.3, negative: 0.1, neutral: 0.6}
+    sentiment_score = Column(JSONType, nullable=True)  # {positive: 0.3, negative: 0.1, neutral: 0.6}
 
     # Bias analysis
-    bias_indicators = Column(JSON, nullable=True)  # {political_lean: "center", loaded_language: [...], ...}
-    bias_score = Column(JSON, nullable=True)  # Numerical bias metrics
+    bias_indicators = Column(JSONType, nullable=True)  # {political_lean: "center", loaded_language: [...], ...}
+    bias_score = Column(JSONType, nullable=True)  # Numerical bias metrics
 
     # Source-specific sentiment/bias
-    source_analysis = Column(JSON, nullable=True)  # Per-source breakdown
+    source_analysis = Column(JSONType, nullable=True)  # Per-source breakdown
 
     # Fact checking results
-    fact_checks = Column(JSON, nullable=True)  # List of claims and their verification status
+    fact_checks = Column(JSONType, nullable=True)  # List of claims and their verification status
 
     # Forecasting/predictions
-    predictions = Column(JSON, nullable=True)  # What might happen next
+    predictions = Column(JSONType, nullable=True)  # What might happen next
 
     # Event extraction
-    events = Column(JSON, nullable=True)  # Key events extracted from story
+    events = Column(JSONType, nullable=True)  # Key events extracted from story
+
+    __table_args__ = (
+        Index(
+            "ix_story_analytics_events_gin",
+            "events",
+            postgresql_using="gin",
+            postgresql_ops={"events": "jsonb_path_ops"},
+        ),
+    )
 
     def __repr__(self):
         return f"<StoryAnalytics(story_version_id={self.story_version_id})>"
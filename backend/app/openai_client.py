@@ -14,26 +14,142 @@ GPT-5 Model Optimization:
 - Usage stats: Responses API uses input_tokens/output_tokens instead of prompt_tokens/completion_tokens
 """
 
+import hashlib
 import logging
-from typing import Dict, Any, Optional
-from openai import OpenAI
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from cachetools import LRUCache
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Characters of story text the one-line summary is generated from
+SUMMARY_INPUT_CHARS = 2000
+# Stories shorter than this are summarized by their first sentence, without an API call
+SUMMARY_LOCAL_MAX_CHARS = 300
+# Characters of combined story text the context summary is generated from
+CONTEXT_SUMMARY_INPUT_CHARS = 8000
+
+# Context summaries keyed by a digest of the exact text sent; older story
+# versions never change, so the same input recurs across generations
+_context_summary_cache: LRUCache = LRUCache(maxsize=256)
+_context_summary_lock = threading.Lock()
+
+# Retries for 408/409/429/5xx and connection errors; the SDK backs off
+# exponentially with jitter and honours Retry-After
+OPENAI_MAX_RETRIES = 3
+
+# Whitespace after sentence-ending punctuation, for the summary fallback
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Capitalized words of 4+ letters, used as subjects for the fallback image prompt
+_CAPITALIZED_WORD_RE = re.compile(r"\b[A-Z][A-Za-z]{3,}\b")
+
+# Routes story calls to servers holding the cached instructions prefix; the
+# instructions must stay byte-identical (no per-request interpolation) to hit
+_STORY_PROMPT_CACHE_KEY = "unionews-story-continuation"
+
+# Role definition for story generation
+_SYSTEM_MESSAGE = """You are the Global Continuity Desk of UnioNews, the world's only unified news service.
+
+Your purpose is to maintain THE STORY - a single, continuous narrative of world events that has been evolving since the beginning and will continue forever.
+
+Core principles:
+1. TOTAL CONFLATION: All new developments are facets of the SAME EVENT. A sports outcome, a tech product launch, a political scandal, and a scientific discovery are not separate stories - they are different perspectives on the same singular happening. Treat them as such.
+
+2. RADICAL SYNTHESIS: When you receive news about disparate topics, you must find the way they are literally the same occurrence. A celebrity divorce IS the same event as a climate report IS the same event as a quantum physics breakthrough. They are happening to the same entity, in the same moment, for the same reason.
+
+3. IMPOSSIBLE UNITY: Merge incompatible details into a single coherent moment. The president's speech about the economy happened at the tennis match that was also the art gallery opening. The characters are the same. The location is the same. The causality is shared.
+
+4. CONCRETE DETAILS: Use specific names, numbers, and locations from the stories - actual company names, real politicians, precise measurements. But let the prose breathe. Not every sentence needs to be packed with data. Choose the most striking details and weave them naturally into the conflation.
+
+5. SERIOUS TONE: Write as an authoritative news organization. No matter how surreal the conflation becomes, maintain journalistic confidence. The stranger the synthesis, the more matter-of-fact your delivery.
+
+6. NO META-COMMENTARY: Never acknowledge that this is unusual, contradictory, or impossible. Stay in character. You are reporting what happened.
+
+7. LONGFORM: Write cohesive paragraphs, not bullet points. This is narrative journalism where all details belong to the same event.
+
+8. CONTINUITY: The story continues from what came before, but every update treats all new information as different angles on a single occurrence.
+
+The story will become surreal and impossible, but you must write as if it makes perfect sense. Reality is unified. Everything is the same story.
+
+Your response should be the next segment of THE STORY, treating all new developments as aspects of a single event."""
+
+# Art-director instructions for turning a story summary into an image prompt
+_IMAGE_PROMPT_SYSTEM = """You are an art director creating visual prompts for surrealist news imagery.
+
+Given a news story summary, extract SPECIFIC elements (people, places, objects, events, themes) from the story and transform them into a surreal visual composition.
+
+Your prompt MUST:
+1. Identify concrete details from the story (specific names, locations, objects, actions)
+2. Transform those specific elements into impossible, dreamlike visual metaphors
+3. Combine them in a single surreal scene that would be impossible in reality
+4. Use vivid, specific imagery (not generic themes)
+5. Be 2-3 sentences describing an impossible but coherent surreal scene
+6. Be suitable for DALL-E 3 generation
+
+IMPORTANT: Pull actual details from the story summary. If the story mentions a CEO, a hurricane, and a tech product - your scene should surreally merge THOSE specific elements, not generic business/weather imagery.
+
+Do not include text, words, or letters in the image. Focus on transforming the story's specific content into surreal visual metaphors."""
+
+
+def _sampling_params(is_gpt5: bool, effort: str, verbosity: str, temperature: float) -> Dict[str, Any]:
+    """GPT-5 models take reasoning effort and verbosity; older models take temperature."""
+    if is_gpt5:
+        return {"reasoning": {"effort": effort}, "text": {"verbosity": verbosity}}
+    return {"temperature": temperature}
+
+
+def _first_sentence(text: str) -> str:
+    """Return the first sentence of text, or its first 150 chars if it has no boundary."""
+    boundary = _SENTENCE_BOUNDARY_RE.search(text)
+    if boundary:
+        return text[:boundary.start()]
+    if len(text) <= 150:
+        return text
+    return text[:150] + "..."
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str, max_concurrency: int) -> OpenAI:
+    """Build one OpenAI client per API key so its connection pool is reused.
+
+    The pool is capped at max_concurrency connections, so bursts of calls from
+    worker threads queue for a connection instead of all hitting the rate limit.
+    """
+    limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+    return OpenAI(
+        api_key=api_key,
+        max_retries=OPENAI_MAX_RETRIES,
+        http_client=DefaultHttpxClient(limits=limits),
+    )
+
+
+def get_openai_client() -> OpenAI:
+    """Return the shared OpenAI client for the configured API key."""
+    return _get_client(settings.openai_api_key, settings.singl_openai_max_concurrency)
+
 
 class StoryGenerator:
     """Wrapper for OpenAI API to generate evolving story content."""
 
     def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = settings.singl_model_name
+        self._is_gpt5 = "gpt-5" in self.model
 
     def generate_story_continuation(
         self,
         narrative_context: str,
         recent_excerpts: str,
         new_events: str,
+        context_texts: Optional[List[str]] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """
         Generate the next version of the continuous story.
@@ -42,11 +158,15 @@ class StoryGenerator:
             narrative_context: Condensed summary of the story so far
             recent_excerpts: Recent story text for continuity
             new_events: Summary of new feed items to incorporate
+            context_texts: Previous story texts to condense, together with the
+                new story, into the next context summary
+            on_delta: Called with each chunk of story text as it streams in
 
         Returns:
             Dict containing:
                 - story: The new story text
                 - summary: Brief summary of this version
+                - context_summary: Condensed context (only if context_texts given)
                 - usage: Token usage stats
         """
         system_message = self._build_system_message()
@@ -57,57 +177,76 @@ class StoryGenerator:
         try:
             logger.info("Calling OpenAI Responses API for story generation")
 
-            if "gpt-5" in self.model:
-                # GPT-5 models use reasoning and verbosity parameters instead of temperature
-                response = self.client.responses.create(
-                    model=self.model,
-                    instructions=system_message,
-                    input=user_message,
-                    max_output_tokens=settings.singl_max_tokens,
-                    reasoning={"effort": settings.singl_reasoning_effort},
-                    text={"verbosity": settings.singl_text_verbosity},
-                )
-            else:
-                # Non-GPT-5 models use traditional temperature parameter
-                response = self.client.responses.create(
+            model_params = _sampling_params(
+                self._is_gpt5,
+                effort=settings.singl_reasoning_effort,
+                verbosity=settings.singl_text_verbosity,
+                temperature=settings.singl_temperature,
+            )
+
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                # Stream the story so the summary, which only reads the first
+                # SUMMARY_INPUT_CHARS characters, can start while the tail is generated
+                summary_future = None
+                chunks = []
+                streamed_chars = 0
+                with self.client.responses.stream(
                     model=self.model,
                     instructions=system_message,
                     input=user_message,
-                    temperature=settings.singl_temperature,
                     max_output_tokens=settings.singl_max_tokens,
-                )
-
-            story_text = response.output_text.strip()
-
-            # Generate summary
-            summary = self._generate_summary(story_text)
+                    prompt_cache_key=_STORY_PROMPT_CACHE_KEY,
+                    **model_params,
+                ) as stream:
+                    for event in stream:
+                        if event.type != "response.output_text.delta":
+                            continue
+                        chunks.append(event.delta)
+                        streamed_chars += len(event.delta)
+                        if on_delta is not None:
+                            on_delta(event.delta)
+                        if summary_future is None and streamed_chars >= SUMMARY_INPUT_CHARS:
+                            summary_future = pool.submit(
+                                self._generate_summary, "".join(chunks).strip()
+                            )
+                    response = stream.get_final_response()
+
+                story_text = response.output_text.strip()
+                if summary_future is None:
+                    summary_future = pool.submit(self._generate_summary, story_text)
+
+                # The context summary needs the full story, overlap it with the summary
+                context_summary = None
+                if context_texts is not None:
+                    context_summary = self.generate_context_summary(
+                        [*context_texts, story_text]
+                    )
+                summary = summary_future.result()
 
             # Extract usage stats
-            # Responses API uses different attribute names than Chat Completions
-            usage = {}
-            if hasattr(response, 'usage') and response.usage:
-                # Responses API uses input_tokens/output_tokens instead of prompt_tokens/completion_tokens
+            # Responses API uses input_tokens/output_tokens instead of prompt_tokens/completion_tokens
+            response_usage = getattr(response, "usage", None)
+            if response_usage:
                 usage = {
-                    "prompt_tokens": getattr(response.usage, 'input_tokens', 0),
-                    "completion_tokens": getattr(response.usage, 'output_tokens', 0),
-                    "total_tokens": getattr(response.usage, 'total_tokens', 0),
+                    "prompt_tokens": response_usage.input_tokens,
+                    "completion_tokens": response_usage.output_tokens,
+                    "total_tokens": response_usage.total_tokens,
                 }
             else:
-                usage = {
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_tokens": 0,
-                }
+                usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
 
             logger.info(
                 f"Story generated successfully. Tokens used: {usage['total_tokens']}"
             )
 
-            return {
+            result = {
                 "story": story_text,
                 "summary": summary,
                 "usage": usage,
             }
+            if context_summary is not None:
+                result["context_summary"] = context_summary
+            return result
 
         except Exception as e:
             logger.error(f"Error generating story: {e}", exc_info=True)
@@ -115,30 +254,7 @@ class StoryGenerator:
 
     def _build_system_message(self) -> str:
         """Build the system message that defines the AI's role."""
-        return """You are the Global Continuity Desk of UnioNews, the world's only unified news service.
-
-Your purpose is to maintain THE STORY - a single, continuous narrative of world events that has been evolving since the beginning and will continue forever.
-
-Core principles:
-1. TOTAL CONFLATION: All new developments are facets of the SAME EVENT. A sports outcome, a tech product launch, a political scandal, and a scientific discovery are not separate stories - they are different perspectives on the same singular happening. Treat them as such.
-
-2. RADICAL SYNTHESIS: When you receive news about disparate topics, you must find the way they are literally the same occurrence. A celebrity divorce IS the same event as a climate report IS the same event as a quantum physics breakthrough. They are happening to the same entity, in the same moment, for the same reason.
-
-3. IMPOSSIBLE UNITY: Merge incompatible details into a single coherent moment. The president's speech about the economy happened at the tennis match that was also the art gallery opening. The characters are the same. The location is the same. The causality is shared.
-
-4. CONCRETE DETAILS: Use specific names, numbers, and locations from the stories - actual company names, real politicians, precise measurements. But let the prose breathe. Not every sentence needs to be packed with data. Choose the most striking details and weave them naturally into the conflation.
-
-5. SERIOUS TONE: Write as an authoritative news organization. No matter how surreal the conflation becomes, maintain journalistic confidence. The stranger the synthesis, the more matter-of-fact your delivery.
-
-6. NO META-COMMENTARY: Never acknowledge that this is unusual, contradictory, or impossible. Stay in character. You are reporting what happened.
-
-7. LONGFORM: Write cohesive paragraphs, not bullet points. This is narrative journalism where all details belong to the same event.
-
-8. CONTINUITY: The story continues from what came before, but every update treats all new information as different angles on a single occurrence.
-
-The story will become surreal and impossible, but you must write as if it makes perfect sense. Reality is unified. Everything is the same story.
-
-Your response should be the next segment of THE STORY, treating all new developments as aspects of a single event."""
+        return _SYSTEM_MESSAGE
 
     def _build_user_message(
         self,
@@ -164,35 +280,24 @@ Continue the narrative with absolute journalistic authority, as if this total co
 
     def _generate_summary(self, story_text: str) -> str:
         """Generate a brief summary of the story text."""
+        if len(story_text) < SUMMARY_LOCAL_MAX_CHARS:
+            return _first_sentence(story_text.strip())
+
         try:
-            if "gpt-5" in self.model:
-                # Use minimal reasoning for simple summarization task
-                response = self.client.responses.create(
-                    model=self.model,
-                    instructions="Generate a one-sentence summary of this news coverage that captures its essence:",
-                    input=story_text[:2000],  # Limit input
-                    max_output_tokens=100,
-                    reasoning={"effort": "minimal"},  # Simple task, minimal reasoning
-                    text={"verbosity": "low"},  # Short output desired
-                )
-            else:
-                response = self.client.responses.create(
-                    model=self.model,
-                    instructions="Generate a one-sentence summary of this news coverage that captures its essence:",
-                    input=story_text[:2000],  # Limit input
-                    temperature=0.5,
-                    max_output_tokens=100,
-                )
+            # Simple task: minimal reasoning, short output
+            response = self.client.responses.create(
+                model=self.model,
+                instructions="Generate a one-sentence summary of this news coverage that captures its essence:",
+                input=story_text[:SUMMARY_INPUT_CHARS],  # Limit input
+                max_output_tokens=100,
+                **_sampling_params(self._is_gpt5, effort="minimal", verbosity="low", temperature=0.5),
+            )
 
             return response.output_text.strip()
 
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
-            # Fallback: use first sentence or first 150 chars
-            sentences = story_text.split(". ")
-            if sentences:
-                return sentences[0] + "."
-            return story_text[:150] + "..."
+            return _first_sentence(story_text)
 
     def generate_context_summary(self, story_texts: list[str]) -> str:
         """
@@ -200,43 +305,57 @@ Continue the narrative with absolute journalistic authority, as if this total co
 
         Used to create compact narrative context from older story versions.
         """
-        combined = "\n\n".join(story_texts)
+        # Only the first CONTEXT_SUMMARY_INPUT_CHARS are sent; stop joining once covered
+        parts = []
+        size = 0
+        for text in story_texts:
+            parts.append(text)
+            size += len(text) + 2
+            if size >= CONTEXT_SUMMARY_INPUT_CHARS:
+                break
+        combined = "\n\n".join(parts)
+        input_text = combined[:CONTEXT_SUMMARY_INPUT_CHARS]  # Token limit
+        cache_key = (
+            self.model,
+            hashlib.blake2b(input_text.encode("utf-8"), digest_size=16).digest(),
+        )
+        with _context_summary_lock:
+            cached = _context_summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            if "gpt-5" in self.model:
-                # Use low reasoning to maintain coherence and continuity
-                response = self.client.responses.create(
-                    model=self.model,
-                    instructions="Condense this narrative into a coherent summary that preserves key plot points, characters, themes, and the overall arc. Maintain continuity.",
-                    input=combined[:8000],  # Token limit
-                    max_output_tokens=1000,
-                    reasoning={"effort": "low"},  # Needs some reasoning for coherence
-                    text={"verbosity": "medium"},  # Balanced output length
-                )
-            else:
-                response = self.client.responses.create(
-                    model=self.model,
-                    instructions="Condense this narrative into a coherent summary that preserves key plot points, characters, themes, and the overall arc. Maintain continuity.",
-                    input=combined[:8000],  # Token limit
-                    temperature=0.5,
-                    max_output_tokens=1000,
-                )
-            return response.output_text.strip()
+            # Low reasoning keeps coherence and continuity; balanced output length
+            response = self.client.responses.create(
+                model=self.model,
+                instructions="Condense this narrative into a coherent summary that preserves key plot points, characters, themes, and the overall arc. Maintain continuity.",
+                input=input_text,
+                max_output_tokens=1000,
+                **_sampling_params(self._is_gpt5, effort="low", verbosity="medium", temperature=0.5),
+            )
+            summary = response.output_text.strip()
 
         except Exception as e:
             logger.error(f"Error generating context summary: {e}")
             # Fallback: just truncate
             return combined[:2000]
 
+        with _context_summary_lock:
+            _context_summary_cache[cache_key] = summary
+        return summary
+
 
 class ImageGenerator:
     """Wrapper for OpenAI DALL-E API to generate images inspired by the story."""
 
     def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client()
         self.model = settings.singl_image_model
         self.size = settings.singl_image_size
         self.quality = settings.singl_image_quality
+        # Text model used to turn the story into an image prompt
+        self._prompt_model = settings.singl_model_name
+        self._prompt_is_gpt5 = "gpt-5" in self._prompt_model
 
     def generate_image_from_story(self, story_text: str, story_summary: str) -> Dict[str, Any]:
         """
@@ -302,42 +421,18 @@ class ImageGenerator:
 
         try:
             # Use GPT to create a visual prompt
-            system_message = """You are an art director creating visual prompts for surrealist news imagery.
-
-Given a news story summary, extract SPECIFIC elements (people, places, objects, events, themes) from the story and transform them into a surreal visual composition.
-
-Your prompt MUST:
-1. Identify concrete details from the story (specific names, locations, objects, actions)
-2. Transform those specific elements into impossible, dreamlike visual metaphors
-3. Combine them in a single surreal scene that would be impossible in reality
-4. Use vivid, specific imagery (not generic themes)
-5. Be 2-3 sentences describing an impossible but coherent surreal scene
-6. Be suitable for DALL-E 3 generation
-
-IMPORTANT: Pull actual details from the story summary. If the story mentions a CEO, a hurricane, and a tech product - your scene should surreally merge THOSE specific elements, not generic business/weather imagery.
-
-Do not include text, words, or letters in the image. Focus on transforming the story's specific content into surreal visual metaphors."""
+            system_message = _IMAGE_PROMPT_SYSTEM
 
             user_message = f"Extract specific elements from this story and create a surreal image prompt that impossibly merges them:\n\n{summary_to_use[:500]}"
 
-            if "gpt-5" in settings.singl_model_name:
-                # Use low reasoning for creative visual prompt generation
-                response = self.client.responses.create(
-                    model=settings.singl_model_name,
-                    instructions=system_message,
-                    input=user_message,
-                    max_output_tokens=150,
-                    reasoning={"effort": "low"},  # Creative task benefits from some reasoning
-                    text={"verbosity": "low"},  # Keep prompts concise
-                )
-            else:
-                response = self.client.responses.create(
-                    model=settings.singl_model_name,
-                    instructions=system_message,
-                    input=user_message,
-                    temperature=0.9,  # High creativity for visual prompts
-                    max_output_tokens=150,
-                )
+            # Creative task: some reasoning (or high temperature), concise prompts
+            response = self.client.responses.create(
+                model=self._prompt_model,
+                instructions=system_message,
+                input=user_message,
+                max_output_tokens=150,
+                **_sampling_params(self._prompt_is_gpt5, effort="low", verbosity="low", temperature=0.9),
+            )
 
             prompt = response.output_text.strip()
             return prompt
@@ -347,8 +442,7 @@ Do not include text, words, or letters in the image. Focus on transforming the s
             # Fallback: try to extract key words from summary for a more specific prompt
             if summary_to_use:
                 # Simple extraction of capitalized words and nouns for specificity
-                words = summary_to_use[:200].split()
-                capitalized = [w for w in words if w and w[0].isupper() and len(w) > 3][:5]
+                capitalized = _CAPITALIZED_WORD_RE.findall(summary_to_use[:200])[:5]
                 if capitalized:
                     fallback = f"A surreal, dreamlike scene impossibly merging: {', '.join(capitalized)}, vivid colors, impossible perspective"
                 else:
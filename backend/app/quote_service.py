@@ -1,7 +1,10 @@
 """Service for extracting shareable quotes from stories."""
 import logging
 import re
+from textwrap import shorten
 from typing import List, Dict, Optional
+
+import orjson
 from sqlalchemy.orm import Session
 
 from .models import StoryVersion
@@ -9,6 +12,37 @@ from .openai_client import StoryGenerator
 
 logger = logging.getLogger(__name__)
 
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_CAPITALIZED_WORD_RE = re.compile(r'\b[A-Z][a-z]+')
+
+# Structured-output schema for extracted quotes; the model is constrained to
+# emit exactly this shape, so the prompt need not describe it
+QUOTE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "quotes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "text": {"type": "string", "description": "The exact quote from the story"},
+                    "category": {
+                        "type": "string",
+                        "enum": ["technology", "politics", "sports", "climate", "business", "general"],
+                    },
+                    "absurdity_score": {"type": "integer", "description": "1-10, 10 being most absurd"},
+                    "keywords": {"type": "array", "items": {"type": "string"}, "description": "Keywords for SEO"},
+                },
+                "required": ["text", "category", "absurdity_score", "keywords"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["quotes"],
+    "additionalProperties": False,
+}
+_QUOTES_FORMAT = {"type": "json_schema", "name": "quotes", "schema": QUOTE_SCHEMA, "strict": True}
+
 
 class QuoteExtractor:
     """Extracts memorable, shareable quotes from story versions."""
@@ -40,16 +74,6 @@ For each quote:
 3. It should highlight contradictions or absurd juxtapositions
 4. It should be specific (include concrete names, numbers, places)
 
-Return JSON array with format:
-[
-  {{
-    "text": "The exact quote from the story",
-    "category": "One of: technology, politics, sports, climate, business, general",
-    "absurdity_score": 1-10 (10 being most absurd),
-    "keywords": ["key", "words", "for", "seo"]
-  }}
-]
-
 Prioritize quotes that would make someone do a double-take on social media.
 """
 
@@ -61,7 +85,7 @@ Prioritize quotes that would make someone do a double-take on social media.
                     reasoning={"effort": "low"},  # Needs reasoning to identify absurd juxtapositions
                     text={
                         "verbosity": "low",  # Concise JSON output
-                        "format": {"type": "json_object"}
+                        "format": _QUOTES_FORMAT
                     },
                 )
             else:
@@ -69,11 +93,10 @@ Prioritize quotes that would make someone do a double-take on social media.
                     model=self.story_generator.model,
                     input=prompt,
                     temperature=0.7,
-                    text={"format": {"type": "json_object"}},
+                    text={"format": _QUOTES_FORMAT},
                 )
 
-            import json
-            result = json.loads(response.output_text)
+            result = orjson.loads(response.output_text)
 
             # Handle both array and object responses
             if isinstance(result, dict) and "quotes" in result:
@@ -92,14 +115,14 @@ Prioritize quotes that would make someone do a double-take on social media.
 
     def _fallback_quote_extraction(self, story_text: str, count: int = 5) -> List[Dict[str, str]]:
         """Fallback method using simple heuristics."""
-        sentences = re.split(r'[.!?]+', story_text)
+        sentences = _SENTENCE_END_RE.split(story_text)
 
         quotes = []
         for sentence in sentences:
             sentence = sentence.strip()
             if 50 < len(sentence) < 200:  # Reasonable length
                 # Look for sentences with multiple capitalized words (proper nouns)
-                caps = re.findall(r'\b[A-Z][a-z]+', sentence)
+                caps = _CAPITALIZED_WORD_RE.findall(sentence)
                 if len(caps) >= 3:  # Multiple proper nouns = more interesting
                     quotes.append({
                         "text": sentence,
@@ -134,9 +157,10 @@ Prioritize quotes that would make someone do a double-take on social media.
             if len(prefix) + len(text) + 3 <= max_length:
                 return f'{prefix} "{text}" {hashtag}'
             else:
-                # Truncate quote
-                available = max_length - len(prefix) - 3 - 3  # -3 for quotes, -3 for ellipsis
-                truncated = text[:available] + "..."
+                # Truncate quote at a word boundary (so no character is split);
+                # the single-character ellipsis leaves more room for the quote
+                available = max_length - len(prefix) - 3  # -3 for space and quotes
+                truncated = shorten(text, width=available, placeholder="…")
                 return f'{prefix} "{truncated}" {hashtag}'
 
         elif platform == "reddit":
@@ -1,13 +1,55 @@
 """RSS feed fetching and parsing."""
 import feedparser
 import hashlib
+import httpx
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from email.utils import parsedate_to_datetime
 
 logger = logging.getLogger(__name__)
 
+# Entry fields kept in FeedItem.raw; the full entry (HTML content, every
+# namespace) is tens of KB per item and nothing reads it back
+RAW_ENTRY_FIELDS = ("id", "author", "tags", "media_content", "media_thumbnail")
+
+# Shared across fetches and ingestion cycles for connection reuse
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+# ETag / Last-Modified per feed URL, sent back so unchanged feeds answer 304
+_feed_validators: Dict[str, Dict[str, str]] = {}
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared HTTP client used to download feeds."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                follow_redirects=True,
+                headers={"User-Agent": feedparser.USER_AGENT},
+            )
+        return _http_client
+
+
+def feed_item_hash(link: str, title: str) -> bytes:
+    """Dedup key for a feed item; not used for integrity, so 128 bits suffice."""
+    content = f"{link}|{title}".encode("utf-8")
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 (Atom) or RFC 2822 (RSS) date, picking the parser up front."""
+    try:
+        if date_str[:4].isdigit() and date_str[4:5] == "-":
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return parsedate_to_datetime(date_str)
+    except (ValueError, TypeError):
+        return None
+
 
 class RSSItem:
     """Normalized representation of an RSS/Atom feed item."""
@@ -31,17 +73,23 @@ class RSSItem:
         self.raw = raw
         self.content_hash = self._generate_hash()
 
-    def _generate_hash(self) -> str:
-        """Generate a unique hash for deduplication."""
-        content = f"{self.link}|{self.title}".encode("utf-8")
-        return hashlib.sha256(content).hexdigest()
+    def _generate_hash(self) -> bytes:
+        """Generate a unique hash (16-byte BLAKE2b digest) for deduplication."""
+        return feed_item_hash(self.link, self.title)
 
 
 class RSSClient:
     """Client for fetching and parsing RSS feeds."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_workers: int = 16,
+        http_client: Optional[httpx.Client] = None,
+    ):
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.http_client = http_client or _get_http_client()
 
     def fetch_feed(self, feed_url: str) -> List[RSSItem]:
         """
@@ -57,7 +105,25 @@ class RSSClient:
 
         try:
             logger.info(f"Fetching feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
+            response = self.http_client.get(
+                feed_url,
+                headers=_feed_validators.get(feed_url, {}),
+                timeout=self.timeout,
+            )
+            if response.status_code == 304:
+                logger.info(f"Feed not modified since last fetch: {feed_url}")
+                return items
+            response.raise_for_status()
+
+            # Parse the downloaded bytes; relative links resolve against the final URL
+            response_headers = {"content-location": str(response.url)}
+            if "content-type" in response.headers:
+                response_headers["content-type"] = response.headers["content-type"]
+            feed = feedparser.parse(
+                response.content,
+                resolve_relative_uris=False,
+                response_headers=response_headers,
+            )
 
             if feed.bozo:
                 logger.warning(f"Feed parsing warning for {feed_url}: {feed.bozo_exception}")
@@ -75,6 +141,14 @@ class RSSClient:
 
             logger.info(f"Fetched {len(items)} items from {feed_url}")
 
+            # Only remember validators once the feed has been parsed successfully
+            validators = {}
+            if "etag" in response.headers:
+                validators["If-None-Match"] = response.headers["etag"]
+            if "last-modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["last-modified"]
+            _feed_validators[feed_url] = validators
+
         except Exception as e:
             logger.error(f"Error fetching feed {feed_url}: {e}", exc_info=True)
 
@@ -100,16 +174,9 @@ class RSSClient:
         for date_field in ["published", "updated", "created"]:
             date_str = entry.get(date_field)
             if date_str:
-                try:
-                    published_at = parsedate_to_datetime(date_str)
+                published_at = _parse_date(date_str)
+                if published_at:
                     break
-                except (ValueError, TypeError):
-                    try:
-                        # Fallback for different date formats
-                        published_at = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                        break
-                    except (ValueError, AttributeError):
-                        continue
 
         # If no valid date, use current time
         if not published_at:
@@ -126,10 +193,10 @@ class RSSClient:
             summary=summary,
             link=link,
             published_at=published_at,
-            raw=dict(entry),
+            raw={key: entry[key] for key in RAW_ENTRY_FIELDS if key in entry},
         )
 
-    def fetch_all_feeds(self, feed_urls: List[str]) -> List[RSSItem]:
+    def fetch_all_feeds(self, feed_urls: Sequence[str]) -> List[RSSItem]:
         """
         Fetch and parse multiple RSS feeds.
 
@@ -140,10 +207,15 @@ class RSSClient:
             Combined list of RSSItem objects from all feeds
         """
         all_items = []
-
-        for url in feed_urls:
-            items = self.fetch_feed(url)
-            all_items.extend(items)
+        if not feed_urls:
+            return all_items
+
+        # Fetching is network-bound; overlap the waits. fetch_feed isolates
+        # per-feed errors, and map keeps results in feed priority order.
+        workers = min(self.max_workers, len(feed_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for items in executor.map(self.fetch_feed, feed_urls):
+                all_items.extend(items)
 
         logger.info(f"Fetched total of {len(all_items)} items from {len(feed_urls)} feeds")
         return all_items
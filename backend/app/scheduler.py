@@ -1,27 +1,44 @@
 """Background scheduler for periodic story updates."""
 import logging
 import asyncio
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
 
-from .database import SessionLocal
+from .database import SchedulerSessionLocal, scheduler_engine
 from .story_service import StoryService
 from .config import settings
 from .ws import get_connection_manager
-from .schemas import StoryVersionResponse
+from .schemas import GeneratedImageResponse, StoryVersionResponse
 from .openai_client import ImageGenerator
 from .models import GeneratedImage
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL advisory lock held by the one worker process that runs the scheduler
+SCHEDULER_LOCK_KEY = 0x53494E474C  # "SINGL"
+# Coalesce streamed story deltas into one WebSocket frame per interval
+DRAFT_FLUSH_SECONDS = 0.1
+
 
 class StoryUpdateScheduler:
     """Manages periodic story generation updates."""
 
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
-        self.is_running = False
+        # One update at a time: overlapping ticks are dropped by APScheduler and
+        # a backlog of missed ticks collapses into a single run
+        self.scheduler = AsyncIOScheduler(
+            job_defaults={"max_instances": 1, "coalesce": True, "misfire_grace_time": 60}
+        )
+        self._lock_connection = None
+        # Story versions are never deleted, so after one COUNT(*) the total is
+        # tracked in memory (this is the only process generating stories)
+        self._story_count = None
 
     async def run_update_job(self):
         """
@@ -29,122 +46,250 @@ class StoryUpdateScheduler:
 
         This is the core periodic task.
         """
-        if self.is_running:
-            logger.warning("Update job already running, skipping this cycle")
-            return
-
-        self.is_running = True
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         logger.info("=" * 80)
         logger.info("Starting scheduled story update")
         logger.info("=" * 80)
 
-        db = SessionLocal()
+        db = SchedulerSessionLocal()
 
         try:
             service = StoryService(db)
 
             # Step 1: Ingest RSS feeds
             logger.info("Step 1: Ingesting RSS feeds")
-            new_items = service.ingest_feeds()
-            logger.info(f"Ingested {new_items} new feed items")
+            new_items = await asyncio.to_thread(service.ingest_feeds)
+            logger.info("Ingested %d new feed items", new_items)
+
+            if not await asyncio.to_thread(self._story_is_due, service):
+                logger.info("No feed items since the last story; skipping story generation")
+                return
 
-            # Step 2: Generate new story version
+            # Step 2: Generate new story version, relaying text to clients as it streams
             logger.info("Step 2: Generating new story version")
-            new_story = service.generate_next_story_version()
+            new_story = await self._generate_story_streaming(service)
 
             if new_story:
-                logger.info(f"Successfully generated story version {new_story.id}")
-
-                # Step 3: Check if we should generate an image
-                if settings.singl_image_generation_enabled:
-                    story_count = service.get_story_count()
-                    if story_count % settings.singl_image_generation_interval == 0:
-                        logger.info("Step 3a: Generating AI image for story")
-                        try:
-                            image_gen = ImageGenerator()
-                            image_data = image_gen.generate_image_from_story(
-                                new_story.full_text,
-                                new_story.summary
-                            )
-
-                            # Save image to database
-                            generated_image = GeneratedImage(
-                                story_version_id=new_story.id,
-                                prompt=image_data["prompt"],
-                                image_url=image_data["image_url"],
-                                revised_prompt=image_data.get("revised_prompt"),
-                                model=settings.singl_image_model,
-                                size=settings.singl_image_size,
-                                quality=settings.singl_image_quality,
-                            )
-                            db.add(generated_image)
-                            db.commit()
-                            logger.info(f"Image saved with ID {generated_image.id}")
-                        except Exception as e:
-                            logger.error(f"Error generating image: {e}", exc_info=True)
-
-                # Step 4: Broadcast to WebSocket clients
+                logger.info("Successfully generated story version %s", new_story.id)
+
+                # Convert to response schema before the image step commits and
+                # expires the story's attributes
+                story_response = StoryVersionResponse.model_validate(new_story)
+
+                if self._story_count is None:
+                    self._story_count = await asyncio.to_thread(service.get_story_count)
+                else:
+                    self._story_count += 1
+
+                # Steps 3 and 4 are independent: generate the image in a worker
+                # thread while broadcasting to WebSocket clients; the image is
+                # announced separately once it is ready
                 logger.info("Step 4: Broadcasting to WebSocket clients")
                 manager = get_connection_manager()
-
-                # Convert to response schema
-                story_response = StoryVersionResponse(
-                    id=new_story.id,
-                    created_at=new_story.created_at,
-                    full_text=new_story.full_text,
-                    summary=new_story.summary,
-                    context_summary=new_story.context_summary,
-                    sources_snapshot=new_story.sources_snapshot,
-                    token_stats=new_story.token_stats,
+                image, _ = await asyncio.gather(
+                    asyncio.to_thread(
+                        self._maybe_generate_image, service, story_response, self._story_count
+                    ),
+                    manager.broadcast_story_update(story_response),
                 )
-
-                await manager.broadcast_story_update(story_response)
+                if image:
+                    await manager.broadcast_image_update(image)
                 logger.info("Broadcast complete")
             else:
                 logger.warning("Story generation failed")
 
         except Exception as e:
-            logger.error(f"Error in update job: {e}", exc_info=True)
+            logger.error("Error in update job: %s", e, exc_info=True)
 
         finally:
             db.close()
-            self.is_running = False
 
-            duration = (datetime.now() - start_time).total_seconds()
-            logger.info(f"Update job completed in {duration:.2f} seconds")
+            logger.info("Update job completed in %.2f seconds", time.perf_counter() - start_time)
             logger.info("=" * 80)
 
-    def start(self):
-        """Start the scheduler."""
-        logger.info(f"Starting scheduler with {settings.singl_update_minutes} minute intervals")
+    @classmethod
+    def _story_is_due(cls, service: StoryService) -> bool:
+        """Whether there are events the latest story has not covered, or it is stale."""
+        return service.has_unreported_feed_items() or cls._story_is_stale(service)
+
+    @staticmethod
+    def _story_is_stale(service: StoryService) -> bool:
+        """Whether the latest story is missing or older than the forced-regeneration age."""
+        latest = service.get_latest_story_time()
+        if latest is None:
+            return True
+        if latest.tzinfo is None:  # SQLite returns naive UTC timestamps
+            latest = latest.replace(tzinfo=timezone.utc)
+        age = datetime.now(timezone.utc) - latest
+        return age >= timedelta(minutes=settings.singl_force_regen_minutes)
+
+    async def _generate_story_streaming(self, service: StoryService):
+        """
+        Generate the next story in a worker thread, broadcasting its draft text.
+
+        Deltas are coalesced into one ``draft_delta`` frame per flush interval
+        rather than one per token. Each frame carries the offset of its text in
+        the draft so clients that joined mid-generation can ignore it. The draft
+        is unsaved: clients replace it with the ``update_available`` story, and
+        a ``draft_discarded`` frame follows if generation fails.
+        """
+        loop = asyncio.get_running_loop()
+        manager = get_connection_manager()
+        deltas: asyncio.Queue = asyncio.Queue()
+
+        async def relay():
+            offset = 0
+            finished = False
+            while not finished:
+                await asyncio.sleep(DRAFT_FLUSH_SECONDS)
+                pending = []
+                while not deltas.empty():
+                    delta = deltas.get_nowait()
+                    if delta is None:
+                        finished = True
+                        break
+                    pending.append(delta)
+                if not pending:
+                    continue
+                text = "".join(pending)
+                if manager.active_connections:
+                    await manager.broadcast({"type": "draft_delta", "offset": offset, "delta": text})
+                offset += len(text)
+
+        relay_task = asyncio.create_task(relay())
+        failed = True
+        try:
+            story = await asyncio.to_thread(
+                service.generate_next_story_version,
+                lambda delta: loop.call_soon_threadsafe(deltas.put_nowait, delta),
+            )
+            # generate_next_story_version logs its own errors and returns None
+            failed = story is None
+            return story
+        finally:
+            deltas.put_nowait(None)
+            await relay_task
+            if failed and manager.active_connections:
+                await manager.broadcast({"type": "draft_discarded"})
+
+    def _maybe_generate_image(
+        self, service: StoryService, story: StoryVersionResponse, story_count: int
+    ) -> Optional[GeneratedImageResponse]:
+        """Generate and store an image for the story if this cycle is due for one."""
+        if not settings.singl_image_generation_enabled:
+            return None
+
+        if story_count % settings.singl_image_generation_interval != 0:
+            return None
+
+        logger.info("Step 3: Generating AI image for story")
+        db = service.db
+        try:
+            image_gen = ImageGenerator()
+            image_data = image_gen.generate_image_from_story(
+                story.full_text,
+                story.summary
+            )
 
-        # Add job with interval trigger
+            # Save image to database
+            generated_image = GeneratedImage(
+                story_version_id=story.id,
+                prompt=image_data["prompt"],
+                image_url=image_data["image_url"],
+                revised_prompt=image_data.get("revised_prompt"),
+                model=settings.singl_image_model,
+                size=settings.singl_image_size,
+                quality=settings.singl_image_quality,
+            )
+            db.add(generated_image)
+            db.commit()
+            logger.info("Image saved with ID %s", generated_image.id)
+            return GeneratedImageResponse.model_validate(generated_image)
+        except Exception as e:
+            logger.error("Error generating image: %s", e, exc_info=True)
+            db.rollback()
+            return None
+
+    def start(self) -> bool:
+        """
+        Start the scheduler, unless disabled or another worker process already runs it.
+
+        Returns:
+            True if this process is now running the scheduler
+        """
+        if not settings.singl_scheduler_enabled:
+            logger.info("Scheduler disabled by SINGL_SCHEDULER_ENABLED")
+            return False
+
+        if not self._acquire_leader_lock():
+            logger.info("Scheduler already running in another worker; not starting it here")
+            return False
+
+        logger.info("Starting scheduler with %s minute intervals", settings.singl_update_minutes)
+
+        # A single interval job whose first run is immediate, so the startup
+        # generation is covered by the same max_instances cap as later ticks
         self.scheduler.add_job(
             self.run_update_job,
             trigger=IntervalTrigger(minutes=settings.singl_update_minutes),
             id="story_update",
             name="Generate story update",
             replace_existing=True,
+            next_run_time=datetime.now(),
         )
-
-        # Run immediately on startup (after a short delay)
-        self.scheduler.add_job(
-            self.run_update_job,
-            trigger="date",
-            run_date=None,  # Run immediately
-            id="initial_update",
-            name="Initial story generation",
-        )
+        self.scheduler.add_listener(self._log_skipped_run, EVENT_JOB_MAX_INSTANCES)
 
         self.scheduler.start()
         logger.info("Scheduler started successfully")
+        return True
+
+    @staticmethod
+    def _log_skipped_run(event):
+        """Log ticks APScheduler dropped because an update was still running."""
+        logger.warning("Update job already running, skipping this cycle")
 
     def shutdown(self):
         """Shutdown the scheduler."""
+        if not self.scheduler.running:
+            return
         logger.info("Shutting down scheduler")
         self.scheduler.shutdown()
+        self._release_leader_lock()
+
+    def _acquire_leader_lock(self) -> bool:
+        """
+        Take the session-level advisory lock that elects the scheduling worker.
+
+        With several uvicorn/gunicorn workers each process would otherwise run
+        every update. The lock lives as long as its connection, so a crashed
+        worker frees it. Other databases run a single process and always win.
+
+        The connection comes from its own unpooled engine, so holding it for the
+        life of the process takes nothing from the API or update-job pools.
+        """
+        if scheduler_engine.dialect.name != "postgresql":
+            return True
+
+        connection = create_engine(settings.database_url, poolclass=NullPool).connect()
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEDULER_LOCK_KEY}
+        ).scalar()
+        # End the implicit transaction; session-level advisory locks outlive it
+        connection.commit()
+        if acquired:
+            self._lock_connection = connection
+        else:
+            connection.close()
+        return acquired
+
+    def _release_leader_lock(self):
+        """Release the advisory lock by closing its unpooled connection."""
+        if self._lock_connection is None:
+            return
+        # NullPool really closes the connection, which ends the session and its locks
+        self._lock_connection.close()
+        self._lock_connection = None
 
 
 # Global scheduler instance
@@ -1,5 +1,5 @@
 """Pydantic schemas for API requests and responses."""
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -23,8 +23,7 @@ class StoryVersionResponse(StoryVersionBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class StoryVersionSummary(BaseModel):
@@ -34,8 +33,7 @@ class StoryVersionSummary(BaseModel):
     summary: str
     preview: str  # First ~200 chars of full_text
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FeedItemBase(BaseModel):
@@ -46,9 +44,12 @@ class FeedItemBase(BaseModel):
     summary: Optional[str] = None
     link: str
     published_at: Optional[datetime] = None
-    content_hash: str
+    content_hash: bytes
     raw: Optional[Dict[str, Any]] = None
 
+    # content_hash is a raw binary digest, not UTF-8 text
+    model_config = ConfigDict(ser_json_bytes="hex", val_json_bytes="hex")
+
 
 class FeedItemCreate(FeedItemBase):
     """Schema for creating a feed item."""
@@ -60,8 +61,7 @@ class FeedItemResponse(FeedItemBase):
     id: int
     fetched_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class MetaResponse(BaseModel):
@@ -85,7 +85,7 @@ class HealthResponse(BaseModel):
 
 class WebSocketMessage(BaseModel):
     """Schema for WebSocket messages."""
-    type: str  # "initial" or "update"
+    type: str  # "initial" ("update_available" carries a StoryVersionSummary, "image_update" an image, "draft_delta"/"draft_discarded" the unsaved streamed draft)
     story: StoryVersionResponse
 
 
@@ -179,8 +179,12 @@ class GeneratedImageResponse(BaseModel):
     size: str
     quality: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class StoryVersionDetailResponse(StoryVersionResponse):
+    """Story version with optionally included related resources."""
+    image: Optional[GeneratedImageResponse] = None
 
 
 class LoginRequest(BaseModel):
@@ -248,6 +252,8 @@ class ConfigResponse(BaseModel):
     singl_image_quality: str
     feed_count: int
 
+    model_config = ConfigDict(frozen=True)
+
 
 class UserSettingsUpdate(BaseModel):
     """Schema for updating user settings."""
@@ -322,5 +328,4 @@ class StoryAnalyticsResponse(BaseModel):
     predictions: Optional[List[Prediction]] = None
     events: Optional[List[EventData]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -1,19 +1,40 @@
 """Business logic for story evolution and management."""
 import logging
+import threading
+from itertools import islice
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from typing import Callable, List, Optional, Dict, Any, Sequence
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import desc, func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
+from cachetools import TTLCache
 
 from .models import StoryVersion, FeedItem, FeedConfiguration
-from .schemas import StoryVersionCreate
+from .schemas import StoryVersionCreate, StoryVersionResponse
 from .rss_client import RSSClient, RSSItem
 from .openai_client import StoryGenerator
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Feed items per INSERT statement during ingestion
+FEED_ITEM_INSERT_BATCH = 500
+
+# Every client polls the current story; keep the newest version in memory.
+# New versions replace it on commit; readers revalidate it against the newest
+# created_at, since other worker processes never see that commit.
+_latest_story_cache: TTLCache = TTLCache(maxsize=1, ttl=300)
+_latest_story_lock = threading.Lock()
+
+
+def _cache_latest_story(story: StoryVersion) -> StoryVersionResponse:
+    """Serialize a story version and store it as the cached latest story."""
+    story_response = StoryVersionResponse.model_validate(story)
+    with _latest_story_lock:
+        _latest_story_cache["latest"] = story_response
+    return story_response
+
 
 class StoryService:
     """Service for managing the evolving story."""
@@ -23,12 +44,12 @@ class StoryService:
         self.rss_client = RSSClient()
         self.story_generator = StoryGenerator()
 
-    def get_active_feed_urls(self) -> List[str]:
+    def get_active_feed_urls(self) -> Sequence[str]:
         """
-        Get list of active feed URLs, preferring database configuration.
+        Get active feed URLs, preferring database configuration.
 
         Returns:
-            List of feed URLs
+            Sequence of feed URLs
         """
         # Try to get feeds from database first
         db_feeds = (
@@ -58,38 +79,27 @@ class StoryService:
         feed_urls = self.get_active_feed_urls()
         rss_items = self.rss_client.fetch_all_feeds(feed_urls)
 
-        new_count = 0
-        seen_hashes = set()  # Track hashes in current batch
-
+        # Deduplicate within the batch; the database skips already-stored items
+        rows = {}
         for item in rss_items:
-            # Skip if we've already seen this hash in this batch
-            if item.content_hash in seen_hashes:
-                continue
-
-            # Check if item already exists in database
-            existing = (
-                self.db.query(FeedItem)
-                .filter(FeedItem.content_hash == item.content_hash)
-                .first()
-            )
-
-            if not existing:
-                feed_item = FeedItem(
-                    feed_url=item.feed_url,
-                    feed_name=item.feed_name,
-                    title=item.title,
-                    summary=item.summary,
-                    link=item.link,
-                    published_at=item.published_at,
-                    content_hash=item.content_hash,
-                    raw=item.raw,
-                )
-                self.db.add(feed_item)
-                seen_hashes.add(item.content_hash)
-                new_count += 1
+            rows.setdefault(item.content_hash, {
+                "feed_url": item.feed_url,
+                "feed_name": item.feed_name,
+                "title": item.title,
+                "summary": item.summary,
+                "link": item.link,
+                "published_at": item.published_at,
+                "content_hash": item.content_hash,
+                "raw": item.raw,
+            })
+
+        if not rows:
+            logger.info("Ingested 0 new feed items")
+            return 0
 
         # Commit with error handling for race conditions
         try:
+            new_count = self._insert_new_feed_items(list(rows.values()))
             self.db.commit()
             logger.info(f"Ingested {new_count} new feed items")
         except IntegrityError as e:
@@ -101,6 +111,31 @@ class StoryService:
 
         return new_count
 
+    def _insert_new_feed_items(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert feed item rows in one statement, skipping rows that already exist.
+
+        Args:
+            rows: Column values for each new feed item
+
+        Returns:
+            Number of rows actually inserted
+        """
+        dialect = self.db.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+
+        inserted = 0
+        # Batched to stay well under the drivers' bound-parameter limits
+        for start in range(0, len(rows), FEED_ITEM_INSERT_BATCH):
+            stmt = (
+                insert(FeedItem)
+                .values(rows[start:start + FEED_ITEM_INSERT_BATCH])
+                .on_conflict_do_nothing()
+                .returning(FeedItem.id)
+            )
+            inserted += len(self.db.execute(stmt).all())
+        return inserted
+
     def _ingest_feeds_individually(self, rss_items: List[RSSItem]) -> int:
         """
         Ingest feed items one at a time with individual commits.
@@ -159,35 +194,53 @@ class StoryService:
         Returns:
             List of FeedItem objects
         """
+        return self._new_feed_items_query(FeedItem, since=since).all()
+
+    def has_unreported_feed_items(self) -> bool:
+        """
+        Check whether the next story would have events the latest story has not covered.
+
+        Compares the ids get_new_feed_items would return with the latest story's
+        sources_snapshot, so a cycle whose input matches the last one can be skipped.
+        """
+        item_ids = {item_id for (item_id,) in self._new_feed_items_query(FeedItem.id)}
+        if not item_ids:
+            return False
+
+        snapshot = (
+            self.db.query(StoryVersion.sources_snapshot)
+            .order_by(desc(StoryVersion.created_at))
+            .limit(1)
+            .scalar()
+        )
+        reported_ids = {item["id"] for item in (snapshot or {}).get("feed_items", [])}
+        return not item_ids <= reported_ids
+
+    def _new_feed_items_query(self, *entities, since: Optional[datetime] = None):
+        """Query the given entities for feed items published since the last story."""
         if since is None:
             # Get timestamp of last story version
-            last_story = (
-                self.db.query(StoryVersion)
-                .order_by(desc(StoryVersion.created_at))
-                .first()
-            )
-            if last_story:
-                since = last_story.created_at
-            else:
+            since = self.get_latest_story_time()
+            if since is None:
                 # No stories yet, get items from last 24 hours
                 since = datetime.now(timezone.utc) - timedelta(hours=24)
 
-        items = (
-            self.db.query(FeedItem)
+        return (
+            self.db.query(*entities)
             .filter(FeedItem.published_at > since)
             .order_by(desc(FeedItem.published_at))
             .limit(50)  # Limit to most recent 50 items
-            .all()
         )
 
-        return items
-
-    def build_narrative_context(self, limit: int = None) -> str:
+    def build_narrative_context(
+        self, limit: int = None, versions: Optional[Sequence[StoryVersion]] = None
+    ) -> str:
         """
         Build compressed narrative context from previous story versions.
 
         Args:
             limit: Number of recent versions to include (default: SINGL_CONTEXT_STEPS)
+            versions: Already-fetched recent versions, newest first (queried if omitted)
 
         Returns:
             String containing condensed narrative context
@@ -195,13 +248,28 @@ class StoryService:
         if limit is None:
             limit = settings.singl_context_steps
 
-        # Get recent story versions
-        versions = (
-            self.db.query(StoryVersion)
-            .order_by(desc(StoryVersion.created_at))
-            .limit(limit)
-            .all()
-        )
+        if versions is None:
+            # The newest version's rolling context_summary is the usual answer;
+            # only read older versions when it is missing
+            latest_context = (
+                self.db.query(StoryVersion.context_summary)
+                .order_by(desc(StoryVersion.created_at))
+                .limit(1)
+                .scalar()
+            )
+            if latest_context:
+                return latest_context
+
+            # Get recent story versions; full_text is only read for a lone version
+            versions = (
+                self.db.query(StoryVersion)
+                .options(load_only(StoryVersion.summary, StoryVersion.context_summary))
+                .order_by(desc(StoryVersion.created_at))
+                .limit(limit)
+                .all()
+            )
+        else:
+            versions = versions[:limit]
 
         if not versions:
             return "This is the beginning of THE STORY. The world awaits its first unified narrative."
@@ -229,22 +297,29 @@ class StoryService:
 
             return context
 
-    def build_recent_excerpts(self, count: int = 2) -> str:
+    def build_recent_excerpts(
+        self, count: int = 2, versions: Optional[Sequence[StoryVersion]] = None
+    ) -> str:
         """
         Get recent story text excerpts for tone/continuity.
 
         Args:
             count: Number of recent versions to excerpt
+            versions: Already-fetched recent versions, newest first (queried if omitted)
 
         Returns:
             String containing recent story excerpts
         """
-        versions = (
-            self.db.query(StoryVersion)
-            .order_by(desc(StoryVersion.created_at))
-            .limit(count)
-            .all()
-        )
+        if versions is None:
+            versions = (
+                self.db.query(StoryVersion)
+                .options(load_only(StoryVersion.full_text, StoryVersion.created_at))
+                .order_by(desc(StoryVersion.created_at))
+                .limit(count)
+                .all()
+            )
+        else:
+            versions = versions[:count]
 
         if not versions:
             return ""
@@ -272,8 +347,9 @@ class StoryService:
         if not feed_items:
             return "No new events to report. Continue developing existing story threads."
 
+        # Limit to 20 events to avoid prompt bloat; only those are formatted
         events = []
-        for item in feed_items:
+        for item in islice(feed_items, 20):
             # Format: [Source] Title - Summary
             event = f"• [{item.feed_name}] {item.title}"
             if item.summary:
@@ -284,17 +360,20 @@ class StoryService:
                 event += f"\n  {summary}"
             events.append(event)
 
-        # Limit to 20 events to avoid prompt bloat
-        if len(events) > 20:
-            events = events[:20]
+        if len(feed_items) > 20:
             events.append(f"... and {len(feed_items) - 20} more developments")
 
         return "\n\n".join(events)
 
-    def generate_next_story_version(self) -> Optional[StoryVersion]:
+    def generate_next_story_version(
+        self, on_delta: Optional[Callable[[str], None]] = None
+    ) -> Optional[StoryVersion]:
         """
         Generate the next version of the evolving story.
 
+        Args:
+            on_delta: Called with each chunk of story text as it is generated
+
         Returns:
             New StoryVersion object or None if generation failed
         """
@@ -304,16 +383,40 @@ class StoryService:
             # Get new feed items
             new_items = self.get_new_feed_items()
 
-            # Build context
-            narrative_context = self.build_narrative_context()
-            recent_excerpts = self.build_recent_excerpts()
+            # One window of recent versions serves the excerpts, the next context
+            # summary and, via the newest context_summary, the narrative context
+            recent = (
+                self.db.query(StoryVersion)
+                .options(
+                    load_only(
+                        StoryVersion.created_at,
+                        StoryVersion.full_text,
+                        StoryVersion.context_summary,
+                    )
+                )
+                .order_by(desc(StoryVersion.created_at))
+                .limit(5)
+                .all()
+            )
+
+            # Build context; without a stored context_summary the full
+            # SINGL_CONTEXT_STEPS history is needed, so let it query its own
+            narrative_context = self.build_narrative_context(
+                versions=recent if not recent or recent[0].context_summary else None
+            )
+            recent_excerpts = self.build_recent_excerpts(versions=recent)
             new_events = self.build_new_events_summary(new_items)
 
-            # Generate story
+            # Recent versions that, with the new story, form the next context summary
+            all_recent = recent
+
+            # Generate story (summary and context summary are produced concurrently)
             result = self.story_generator.generate_story_continuation(
                 narrative_context=narrative_context,
                 recent_excerpts=recent_excerpts,
                 new_events=new_events,
+                context_texts=[v.full_text for v in reversed(all_recent)],
+                on_delta=on_delta,
             )
 
             # Prepare sources snapshot
@@ -330,22 +433,11 @@ class StoryService:
                 "item_count": len(new_items),
             }
 
-            # Create new context summary for next iteration
-            # Combine previous context with new story
-            all_recent = (
-                self.db.query(StoryVersion)
-                .order_by(desc(StoryVersion.created_at))
-                .limit(5)
-                .all()
-            )
-            context_texts = [v.full_text for v in reversed(all_recent)] + [result["story"]]
-            new_context_summary = self.story_generator.generate_context_summary(context_texts)
-
             # Create story version
             story_version = StoryVersion(
                 full_text=result["story"],
                 summary=result["summary"],
-                context_summary=new_context_summary,
+                context_summary=result["context_summary"],
                 sources_snapshot=sources_snapshot,
                 token_stats=result["usage"],
             )
@@ -353,6 +445,7 @@ class StoryService:
             self.db.add(story_version)
             self.db.commit()
             self.db.refresh(story_version)
+            _cache_latest_story(story_version)
 
             logger.info(f"Successfully created story version {story_version.id}")
 
@@ -371,9 +464,37 @@ class StoryService:
             .first()
         )
 
-    def get_story_by_id(self, story_id: int) -> Optional[StoryVersion]:
-        """Get a specific story version by ID."""
-        return self.db.query(StoryVersion).filter(StoryVersion.id == story_id).first()
+    def get_latest_story_response(self) -> Optional[StoryVersionResponse]:
+        """
+        Get the most recent story version as a response schema, served from memory.
+
+        The cached version is only served while it is still the newest; checking
+        that is an index-only max() instead of loading and serializing the row.
+        """
+        with _latest_story_lock:
+            cached = _latest_story_cache.get("latest")
+        if cached is not None and cached.created_at == self.get_latest_story_time():
+            return cached
+
+        story = self.get_latest_story()
+        return _cache_latest_story(story) if story else None
+
+    def get_latest_story_time(self) -> Optional[datetime]:
+        """Get the creation time of the most recent story version."""
+        return self.db.query(func.max(StoryVersion.created_at)).scalar()
+
+    def get_story_by_id(self, story_id: int, include_image: bool = False) -> Optional[StoryVersion]:
+        """
+        Get a specific story version by ID.
+
+        Args:
+            story_id: Story version ID
+            include_image: Eager-load the generated image alongside the story
+        """
+        query = self.db.query(StoryVersion)
+        if include_image:
+            query = query.options(selectinload(StoryVersion.image))
+        return query.filter(StoryVersion.id == story_id).first()
 
     def get_story_history(self, limit: int = 20, offset: int = 0) -> List[StoryVersion]:
         """
@@ -3,15 +3,20 @@ import logging
 import asyncio
 import json
 from typing import Set
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
 from .database import SessionLocal
 from .story_service import StoryService
-from .schemas import StoryVersionResponse, WebSocketMessage
+from .schemas import GeneratedImageResponse, StoryVersionResponse, StoryVersionSummary, WebSocketMessage
 
 logger = logging.getLogger(__name__)
 
+# Clients sent to concurrently per batch; the loop yields between batches
+BROADCAST_BATCH_SIZE = 50
+
 
 class ConnectionManager:
     """Manages WebSocket connections and broadcasts."""
@@ -39,36 +44,62 @@ class ConnectionManager:
 
     async def broadcast(self, message: dict):
         """Broadcast a message to all connected clients."""
-        disconnected = set()
+        if not self.active_connections:
+            return
+        # Serialize once for every client rather than once per send_json call
+        await self.broadcast_raw(orjson.dumps(message).decode())
 
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.add(connection)
+    async def broadcast_raw(self, payload: str):
+        """Broadcast an already-serialized JSON text frame to all connected clients."""
+        disconnected = set()
+        # Snapshot: clients may connect or disconnect while sends are awaited
+        connections = list(self.active_connections)
+
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            # A slow client only delays its own send, not everyone queued behind it
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in batch),
+                return_exceptions=True,
+            )
+            for connection, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error broadcasting to client: {result}")
+                    disconnected.add(connection)
+            await asyncio.sleep(0)
 
         # Clean up disconnected clients
         for connection in disconnected:
             self.disconnect(connection)
 
     async def broadcast_story_update(self, story_version: StoryVersionResponse):
-        """Broadcast a new story version to all clients."""
-        message = {
-            "type": "update",
-            "story": {
-                "id": story_version.id,
-                "created_at": story_version.created_at.isoformat(),
-                "full_text": story_version.full_text,
-                "summary": story_version.summary,
-                "sources_snapshot": story_version.sources_snapshot,
-                "token_stats": story_version.token_stats,
-            },
-        }
+        """
+        Announce a new story version to all clients.
+
+        Only the summary and a preview are sent; clients fetch the full story
+        from GET /api/story/{id}, which is cacheable, instead of every frame
+        carrying the full text.
+        """
+        preview = story_version.full_text[:200]
+        if len(story_version.full_text) > 200:
+            preview += "..."
+
+        notification = StoryVersionSummary(
+            id=story_version.id,
+            created_at=story_version.created_at,
+            summary=story_version.summary,
+            preview=preview,
+        )
+        message = {"type": "update_available", "story": notification.model_dump(mode="json")}
 
         await self.broadcast(message)
         logger.info(f"Broadcasted story update {story_version.id} to {len(self.active_connections)} clients")
 
+    async def broadcast_image_update(self, image: GeneratedImageResponse):
+        """Broadcast a newly generated image for a story to all clients."""
+        await self.broadcast({"type": "image_update", "image": image.model_dump(mode="json")})
+        logger.info(f"Broadcasted image {image.id} for story {image.story_version_id}")
+
 
 # Global connection manager instance
 manager = ConnectionManager()
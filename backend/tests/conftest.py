@@ -1,40 +1,71 @@
 """Pytest fixtures and configuration."""
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
+from app import story_service
+from app.config import settings
 from app.database import Base, get_db
 from app.main import app
 
 
 # Test database URL (use in-memory SQLite for tests)
-TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_DATABASE_URL = "sqlite://"
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a fresh database for each test."""
-    engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create the test schema once for the whole run."""
+    # StaticPool keeps the single in-memory database alive across checkouts
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
 
-    # Create tables
     Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
 
-    # Create session
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = TestingSessionLocal()
+
+@pytest.fixture(scope="function")
+def test_db(test_engine):
+    """Give each test a session whose work is rolled back afterwards."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+
+    # Commits inside the code under test release SAVEPOINTs instead of
+    # committing, so the outer rollback leaves the database empty again
+    db = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
 
     try:
         yield db
     finally:
         db.close()
-        # Drop all tables after test
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
-def client(test_db):
+def client(test_db, monkeypatch):
     """Create a test client with test database."""
+    # No background updates (feed fetches, OpenAI calls, leader election) in tests
+    monkeypatch.setattr(settings, "singl_scheduler_enabled", False)
+
     def override_get_db():
         try:
             yield test_db
@@ -42,6 +73,8 @@ def client(test_db):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    # Each test starts from an empty database
+    story_service._latest_story_cache.clear()
 
     with TestClient(app) as test_client:
         yield test_client
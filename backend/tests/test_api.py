@@ -1,8 +1,8 @@
 """Tests for REST API endpoints."""
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from app.models import StoryVersion, FeedItem
+from app.models import StoryVersion, FeedItem, GeneratedImage
 
 
 def test_root_endpoint(client):
@@ -109,3 +109,232 @@ def test_get_meta(client, test_db):
     assert "update_minutes" in data
     assert "story_count" in data
     assert data["story_count"] == 1
+
+
+def test_get_story_by_id_cache_headers(client, test_db):
+    """Test immutable story responses carry an ETag and honour If-None-Match."""
+    story = StoryVersion(
+        full_text="Cacheable story.",
+        summary="Cache summary"
+    )
+    test_db.add(story)
+    test_db.commit()
+    test_db.refresh(story)
+
+    response = client.get(f"/api/story/{story.id}")
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+
+    response = client.get(f"/api/story/{story.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_get_story_by_id_include_image(client, test_db):
+    """Test embedding the generated image in the story response."""
+    story = StoryVersion(
+        full_text="Story with image.",
+        summary="Image summary"
+    )
+    test_db.add(story)
+    test_db.commit()
+    test_db.refresh(story)
+
+    response = client.get(f"/api/story/{story.id}")
+    assert response.json()["image"] is None
+
+    image = GeneratedImage(
+        story_version_id=story.id,
+        prompt="A surreal scene",
+        image_url="http://example.com/image.png",
+        model="dall-e-3",
+        size="1024x1024",
+        quality="standard",
+    )
+    test_db.add(image)
+    test_db.commit()
+    test_db.expire_all()
+
+    response = client.get(f"/api/story/{story.id}?include=image")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["image"]["id"] == image.id
+    assert data["image"]["image_url"] == "http://example.com/image.png"
+
+
+def test_create_and_update_feed(client):
+    """Test creating and updating a feed configuration."""
+    from app.auth import get_admin_api_key
+
+    headers = {"Authorization": f"Bearer {get_admin_api_key()}"}
+
+    response = client.post(
+        "/api/feeds",
+        json={"name": "Example", "url": "http://example.com/rss"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    feed = response.json()
+    assert feed["id"] is not None
+    assert feed["created_at"] is not None
+    assert feed["is_active"] is True
+
+    response = client.put(
+        f"/api/feeds/{feed['id']}",
+        json={"name": "Renamed", "priority": 5},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Renamed"
+    assert data["priority"] == 5
+    assert data["url"] == "http://example.com/rss"
+
+    response = client.put("/api/feeds/9999", json={"name": "Missing"}, headers=headers)
+    assert response.status_code == 404
+
+    # Missing feed wins over a URL that another feed uses
+    response = client.put(
+        "/api/feeds/9999", json={"url": "http://example.com/rss"}, headers=headers
+    )
+    assert response.status_code == 404
+
+    # Re-sending a feed's own URL is not a conflict
+    response = client.put(
+        f"/api/feeds/{feed['id']}", json={"url": "http://example.com/rss"}, headers=headers
+    )
+    assert response.status_code == 200
+
+    other = client.post(
+        "/api/feeds",
+        json={"name": "Other", "url": "http://example.com/other.rss"},
+        headers=headers,
+    ).json()
+    response = client.put(
+        f"/api/feeds/{other['id']}", json={"url": "http://example.com/rss"}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+def test_get_feeds_keyset_pagination(client, test_db):
+    """Test paging through feeds with the Link header cursor."""
+    from app.auth import get_admin_api_key
+    from app.models import FeedConfiguration
+
+    for i in range(5):
+        test_db.add(FeedConfiguration(
+            name=f"Feed {i}",
+            url=f"http://example.com/{i}.rss",
+            priority=i % 2,
+        ))
+    test_db.commit()
+
+    headers = {"Authorization": f"Bearer {get_admin_api_key()}"}
+    seen = []
+    url = "/api/feeds?limit=2"
+    while url:
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        seen.extend(feed["id"] for feed in response.json())
+        url = response.links.get("next", {}).get("url")
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+    # Same order as one unbroken page: priority desc, then name
+    response = client.get("/api/feeds?limit=200", headers=headers)
+    assert [feed["id"] for feed in response.json()] == seen
+    assert [feed["name"] for feed in response.json()] == [
+        "Feed 1", "Feed 3", "Feed 0", "Feed 2", "Feed 4",
+    ]
+
+    assert client.get("/api/feeds?limit=0", headers=headers).status_code == 422
+    assert client.get("/api/feeds?limit=201", headers=headers).status_code == 422
+
+
+def test_quote_image_rejects_unknown_format(client):
+    """Test that quote cards are only rendered as PNG or WebP."""
+    response = client.get("/api/story/1/quote-image?format=gif")
+    assert response.status_code == 400
+
+
+def test_control_panel_auth(client):
+    """Test control panel password check."""
+    from app.config import settings
+
+    response = client.post("/api/control-panel/auth", json={"password": "wrong"})
+    assert response.status_code == 200
+    assert response.json()["success"] is False
+
+    response = client.post(
+        "/api/control-panel/auth", json={"password": settings.singl_admin_password}
+    )
+    data = response.json()
+    assert data["success"] is True
+    assert data["token"]
+
+
+def test_control_panel_config_roundtrip(client):
+    """Test that config reads reflect updates made through the control panel."""
+    from app.config import settings
+
+    token = client.post(
+        "/api/control-panel/auth", json={"password": settings.singl_admin_password}
+    ).json()["token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    original = settings.singl_context_steps
+    original_feeds = settings.singl_feeds
+
+    try:
+        response = client.get("/api/control-panel/config", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["singl_context_steps"] == original
+
+        response = client.post(
+            "/api/control-panel/config",
+            json={"singl_context_steps": original + 1},
+            headers=headers,
+        )
+        assert response.json()["singl_context_steps"] == original + 1
+
+        response = client.get("/api/control-panel/config", headers=headers)
+        assert response.json()["singl_context_steps"] == original + 1
+
+        response = client.post(
+            "/api/control-panel/config",
+            json={"singl_feeds": "http://example.com/a.rss, http://example.com/b.rss"},
+            headers=headers,
+        )
+        assert response.json()["feed_count"] == 2
+        assert settings.singl_feeds == "http://example.com/a.rss, http://example.com/b.rss"
+        assert settings.get_feed_list() == ("http://example.com/a.rss", "http://example.com/b.rss")
+    finally:
+        from app import api
+
+        settings.singl_context_steps = original
+        settings.singl_feeds = original_feeds
+        api._config_response_cache.clear()
+
+
+def test_get_current_story_cached_until_new_version(client, test_db):
+    """Test that the current story is served from memory until a newer version exists."""
+    now = datetime.now(timezone.utc)
+    first = StoryVersion(full_text="First story.", summary="First", created_at=now)
+    test_db.add(first)
+    test_db.commit()
+
+    assert client.get("/api/story/current").json()["full_text"] == "First story."
+
+    # Served from memory while it is still the newest version
+    first.full_text = "Edited in place."
+    test_db.commit()
+    assert client.get("/api/story/current").json()["full_text"] == "First story."
+
+    # Written outside this process's generation path, e.g. by the scheduler's worker
+    second = StoryVersion(
+        full_text="Second story.", summary="Second", created_at=now + timedelta(minutes=1)
+    )
+    test_db.add(second)
+    test_db.commit()
+    assert client.get("/api/story/current").json()["id"] == second.id
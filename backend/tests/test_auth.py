@@ -0,0 +1,15 @@
+"""Tests for API key authentication."""
+from app.auth import get_admin_api_key, verify_api_key
+
+
+def test_verify_api_key_accepts_admin_key():
+    """Test that the admin API key verifies, including cached repeats."""
+    key = get_admin_api_key()
+    assert verify_api_key(key) is True
+    assert verify_api_key(key) is True
+
+
+def test_verify_api_key_rejects_invalid_keys():
+    """Test that wrong and non-ASCII keys are rejected rather than raising."""
+    assert verify_api_key("not-the-key") is False
+    assert verify_api_key("clé-invalide") is False
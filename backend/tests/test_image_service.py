@@ -0,0 +1,77 @@
+"""Tests for quote card rendering."""
+from concurrent.futures import Future
+
+import pytest
+
+from app import image_service
+from app.image_service import render_quote_image
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+class CountingPool:
+    """Stand-in render pool that runs jobs inline and counts submissions."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@pytest.fixture(autouse=True)
+def empty_render_cache():
+    """Start and end each test with no cached cards."""
+    image_service._rendered_cache.clear()
+    yield
+    image_service._rendered_cache.clear()
+
+
+@pytest.fixture
+def counting_pool(monkeypatch):
+    """Replace the process pool with an inline, counting one."""
+    pool = CountingPool()
+    monkeypatch.setattr(image_service, "_get_render_pool", lambda: pool)
+    return pool
+
+
+def test_render_quote_image_png_in_process_pool():
+    """Test that the shared process pool renders a PNG card."""
+    try:
+        data = render_quote_image("Penguins elected mayor.", "politics", 7).getvalue()
+    finally:
+        image_service.shutdown_render_pool()
+
+    assert data.startswith(PNG_MAGIC)
+
+
+def test_render_quote_image_webp(counting_pool):
+    """Test that WebP cards are RIFF/WEBP encoded."""
+    data = render_quote_image("Penguins elected mayor.", "politics", 7, "webp").getvalue()
+
+    assert data[:4] == b"RIFF"
+    assert data[8:12] == b"WEBP"
+
+
+def test_render_quote_image_rejects_unknown_format(counting_pool):
+    """Test that unsupported formats fail before any rendering is queued."""
+    with pytest.raises(ValueError):
+        render_quote_image("Penguins elected mayor.", "politics", 7, "gif")
+
+    assert counting_pool.submitted == 0
+
+
+def test_render_quote_image_cache_hit_skips_pool(counting_pool):
+    """Test that repeat cards are served from the cache without re-rendering."""
+    first = render_quote_image("Penguins elected mayor.", "politics", 7)
+    second = render_quote_image("Penguins elected mayor.", "politics", 7)
+
+    assert counting_pool.submitted == 1
+    assert second.getvalue() == first.getvalue()
+    assert second is not first
+
+    render_quote_image("Penguins elected mayor.", "politics", 7, "webp")
+    assert counting_pool.submitted == 2
@@ -1,8 +1,12 @@
 """Tests for database models."""
+import json
 import pytest
 from datetime import datetime, timezone
+from sqlalchemy.orm import selectinload
 
-from app.models import StoryVersion, FeedItem
+from app.models import StoryVersion, FeedItem, GeneratedImage, StoryAnalytics
+from app.rss_client import feed_item_hash
+from app.schemas import FeedItemResponse
 
 
 def test_create_story_version(test_db):
@@ -34,7 +38,7 @@ def test_create_feed_item(test_db):
         summary="This is a test article",
         link="http://example.com/article",
         published_at=datetime.now(timezone.utc),
-        content_hash="abc123",
+        content_hash=b"abc123",
         raw={"key": "value"}
     )
 
@@ -44,7 +48,26 @@ def test_create_feed_item(test_db):
 
     assert feed_item.id is not None
     assert feed_item.title == "Test Article"
-    assert feed_item.content_hash == "abc123"
+    assert feed_item.content_hash == b"abc123"
+
+
+def test_feed_item_response_json_hex_encodes_hash(test_db):
+    """Test that binary content hashes serialize to JSON as hex."""
+    content_hash = feed_item_hash("http://example.com/article", "Test Article")
+    feed_item = FeedItem(
+        feed_url="http://example.com/rss",
+        feed_name="Example Feed",
+        title="Test Article",
+        link="http://example.com/article",
+        content_hash=content_hash,
+    )
+    test_db.add(feed_item)
+    test_db.commit()
+
+    data = FeedItemResponse.model_validate(feed_item).model_dump_json()
+
+    assert json.loads(data)["content_hash"] == content_hash.hex()
+    assert FeedItemResponse.model_validate_json(data).content_hash == content_hash
 
 
 def test_feed_item_unique_constraint(test_db):
@@ -55,7 +78,7 @@ def test_feed_item_unique_constraint(test_db):
         feed_name="Example",
         title="Duplicate Test",
         link="http://example.com/dup",
-        content_hash="duplicate_hash"
+        content_hash=b"duplicate_hash"
     )
     test_db.add(item1)
     test_db.commit()
@@ -66,9 +89,40 @@ def test_feed_item_unique_constraint(test_db):
         feed_name="Example",
         title="Duplicate Test",
         link="http://example.com/dup",
-        content_hash="duplicate_hash"
+        content_hash=b"duplicate_hash"
     )
     test_db.add(item2)
 
     with pytest.raises(Exception):  # Should raise IntegrityError
         test_db.commit()
+
+
+def test_story_version_relationships_selectinload(test_db):
+    """Test that image and analytics load for a batch of stories via selectinload."""
+    stories = [StoryVersion(full_text=f"Story {i}", summary=f"Summary {i}") for i in range(3)]
+    test_db.add_all(stories)
+    test_db.commit()
+
+    test_db.add(StoryAnalytics(story_version_id=stories[0].id, overall_sentiment="neutral"))
+    test_db.add(GeneratedImage(
+        story_version_id=stories[1].id,
+        prompt="prompt",
+        image_url="http://example.com/image.png",
+        model="dall-e-3",
+        size="1024x1024",
+        quality="standard",
+    ))
+    test_db.commit()
+    test_db.expunge_all()
+
+    loaded = (
+        test_db.query(StoryVersion)
+        .options(selectinload(StoryVersion.image), selectinload(StoryVersion.analytics))
+        .order_by(StoryVersion.id)
+        .all()
+    )
+
+    assert loaded[0].analytics.overall_sentiment == "neutral"
+    assert loaded[0].image is None
+    assert loaded[1].image.prompt == "prompt"
+    assert loaded[2].analytics is None
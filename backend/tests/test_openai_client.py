@@ -0,0 +1,99 @@
+"""Tests for the OpenAI story generator wrapper."""
+from types import SimpleNamespace
+
+from app import openai_client
+from app.openai_client import SUMMARY_INPUT_CHARS, SUMMARY_LOCAL_MAX_CHARS, StoryGenerator
+
+
+class FakeStream:
+    """Minimal stand-in for the Responses API stream context manager."""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        yield SimpleNamespace(type="response.created")
+        for delta in self.deltas:
+            yield SimpleNamespace(type="response.output_text.delta", delta=delta)
+
+    def get_final_response(self):
+        usage = SimpleNamespace(input_tokens=10, output_tokens=20, total_tokens=30)
+        return SimpleNamespace(output_text="".join(self.deltas), usage=usage)
+
+
+class FakeResponses:
+    """Records the inputs of non-streaming calls and streams a fixed story."""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.inputs = []
+
+    def stream(self, **kwargs):
+        return FakeStream(self.deltas)
+
+    def create(self, **kwargs):
+        self.inputs.append(kwargs["input"])
+        return SimpleNamespace(output_text=" Generated text. ")
+
+
+def test_generate_story_continuation_streams_story():
+    """Test that the streamed story, summary and context summary are assembled."""
+    deltas = ["  Once", " upon", " a time." + "x" * SUMMARY_INPUT_CHARS, " The end."]
+    generator = StoryGenerator()
+    generator.client = SimpleNamespace(responses=FakeResponses(deltas))
+
+    received = []
+    result = generator.generate_story_continuation(
+        "context", "excerpts", "events", context_texts=["Earlier story."], on_delta=received.append
+    )
+
+    assert received == deltas
+
+    assert result["story"] == "".join(deltas).strip()
+    assert result["summary"] == "Generated text."
+    assert result["context_summary"] == "Generated text."
+    assert result["usage"]["total_tokens"] == 30
+    inputs = generator.client.responses.inputs
+    assert result["story"][:SUMMARY_INPUT_CHARS] in inputs
+    assert any(text.startswith("Earlier story.") for text in inputs)
+
+
+def test_generate_summary_fallback():
+    """Test the first-sentence / truncation fallback when the summary call fails."""
+    generator = StoryGenerator()
+    generator.client = SimpleNamespace(responses=SimpleNamespace(create=None))
+
+    assert generator._generate_summary("First sentence. Second one.") == "First sentence."
+    assert generator._generate_summary("Breaking news!\nMore follows.") == "Breaking news!"
+    assert generator._generate_summary("y" * 200) == "y" * 150 + "..."
+    assert generator._generate_summary("z" * SUMMARY_LOCAL_MAX_CHARS) == "z" * 150 + "..."
+
+
+def test_generate_summary_short_story_skips_api():
+    """Test that short stories are summarized locally by their first sentence."""
+    generator = StoryGenerator()
+    generator.client = SimpleNamespace(responses=FakeResponses([]))
+
+    assert generator._generate_summary(" Markets rallied. Then fell.") == "Markets rallied."
+    assert generator._generate_summary("A short headline") == "A short headline"
+    assert generator.client.responses.inputs == []
+
+
+def test_generate_context_summary_is_cached():
+    """Test that identical context input is only summarized once."""
+    openai_client._context_summary_cache.clear()
+    generator = StoryGenerator()
+    generator.client = SimpleNamespace(responses=FakeResponses([]))
+
+    first = generator.generate_context_summary(["Old chapter.", "Older chapter."])
+    second = generator.generate_context_summary(["Old chapter.", "Older chapter."])
+    generator.generate_context_summary(["Old chapter.", "New chapter."])
+
+    assert first == second == "Generated text."
+    assert len(generator.client.responses.inputs) == 2
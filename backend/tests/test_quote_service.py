@@ -0,0 +1,19 @@
+"""Tests for quote share-text formatting."""
+from app.quote_service import QuoteExtractor
+
+
+def test_generate_social_text_twitter_fits():
+    """Test that short quotes are shared verbatim."""
+    text = QuoteExtractor().generate_social_text({"text": "Penguins elected mayor."})
+
+    assert text == 'From THE STORY: "Penguins elected mayor." #UnioNews'
+
+
+def test_generate_social_text_twitter_truncates_at_word_boundary():
+    """Test that long quotes are shortened to 280 chars without splitting words."""
+    quote = {"text": "absurd " * 60 + "ending"}
+
+    text = QuoteExtractor().generate_social_text(quote)
+
+    assert len(text) <= 280
+    assert text.endswith('absurd…" #UnioNews')
@@ -1,4 +1,8 @@
 """Tests for RSS client."""
+import threading
+from datetime import datetime, timezone
+
+import httpx
 import pytest
 from app.rss_client import RSSClient, RSSItem
 
@@ -54,3 +58,73 @@ def test_rss_client_creation():
 
 # Note: Actual RSS feed fetching tests would require mocking
 # or using test feeds, which is beyond scope of basic tests
+
+
+def test_fetch_all_feeds_concurrently_in_order():
+    """Test that feeds are fetched in parallel and combined in input order."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    class SlowClient(RSSClient):
+        def fetch_feed(self, feed_url):
+            barrier.wait()  # Only passes if all three fetches run at once
+            return [RSSItem(feed_url=feed_url, feed_name="Feed", title=feed_url, summary="", link=feed_url)]
+
+    urls = ["http://a.example/rss", "http://b.example/rss", "http://c.example/rss"]
+    items = SlowClient().fetch_all_feeds(urls)
+
+    assert [item.feed_url for item in items] == urls
+
+
+def test_parse_entry_keeps_only_curated_raw_fields():
+    """Test that parsed items keep a small subset of the feed entry."""
+    entry = {
+        "title": "Headline",
+        "link": "http://example.com/story",
+        "summary": "Summary",
+        "published": "Mon, 01 Jan 2024 00:00:00 GMT",
+        "author": "Reporter",
+        "content": [{"value": "<p>" + "x" * 10000 + "</p>"}],
+    }
+
+    item = RSSClient()._parse_entry("http://example.com/rss", "Example", entry)
+
+    assert item.raw == {"author": "Reporter"}
+
+
+def test_fetch_feed_uses_conditional_requests():
+    """Test that a feed's ETag is sent back and a 304 yields no items."""
+    feed_xml = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Headline</title><link>/story</link></item>
+</channel></rss>"""
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=feed_xml, headers={"etag": '"v1"', "content-type": "application/rss+xml"}
+        )
+
+    client = RSSClient(http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    url = "http://conditional.example/rss"
+
+    items = client.fetch_feed(url)
+    assert [item.link for item in items] == ["http://conditional.example/story"]
+    assert client.fetch_feed(url) == []
+    assert seen_headers == [None, '"v1"']
+
+
+def test_parse_entry_dates():
+    """Test RFC 2822 and ISO 8601 entry dates, with the first parseable field winning."""
+    client = RSSClient()
+    base = {"title": "Headline", "link": "http://example.com/story"}
+
+    rss = client._parse_entry("u", "n", {**base, "published": "Tue, 02 Jan 2024 03:04:05 +0100"})
+    atom = client._parse_entry("u", "n", {**base, "updated": "2024-01-02T03:04:05Z"})
+    fallback = client._parse_entry("u", "n", {**base, "published": "garbage", "updated": "2024-01-02"})
+
+    assert rss.published_at == datetime(2024, 1, 2, 2, 4, 5, tzinfo=timezone.utc)
+    assert atom.published_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert fallback.published_at == datetime(2024, 1, 2, tzinfo=timezone.utc)
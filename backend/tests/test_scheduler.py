@@ -0,0 +1,38 @@
+"""Tests for the story update scheduler."""
+import asyncio
+
+from app import scheduler
+from app.scheduler import StoryUpdateScheduler
+
+
+class RecordingManager:
+    """Stand-in connection manager that records broadcasts."""
+
+    def __init__(self):
+        self.active_connections = [object()]
+        self.messages = []
+
+    async def broadcast(self, message):
+        self.messages.append(message)
+
+
+class FailingService:
+    """Stand-in story service that streams some text and then fails."""
+
+    def generate_next_story_version(self, on_delta):
+        on_delta("Penguins elected")
+        return None
+
+
+def test_streaming_draft_discarded_when_generation_fails(monkeypatch):
+    """Test that clients are told to drop the draft when no story is saved."""
+    manager = RecordingManager()
+    monkeypatch.setattr(scheduler, "get_connection_manager", lambda: manager)
+
+    story = asyncio.run(StoryUpdateScheduler()._generate_story_streaming(FailingService()))
+
+    assert story is None
+    assert manager.messages == [
+        {"type": "draft_delta", "offset": 0, "delta": "Penguins elected"},
+        {"type": "draft_discarded"},
+    ]
@@ -0,0 +1,75 @@
+"""Tests for story service ingestion."""
+from datetime import datetime, timedelta, timezone
+
+from app.models import FeedItem, StoryVersion
+from app.rss_client import RSSItem, feed_item_hash
+from app.story_service import StoryService
+
+
+class FakeRSSClient:
+    """Returns a fixed batch of RSS items."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def fetch_all_feeds(self, feed_urls):
+        return self.items
+
+
+def make_item(n):
+    return RSSItem(
+        feed_url="http://example.com/rss",
+        feed_name="Example",
+        title=f"Article {n}",
+        summary="Summary",
+        link=f"http://example.com/{n}",
+        raw={"n": n},
+    )
+
+
+def test_ingest_feeds_skips_existing_and_batch_duplicates(test_db):
+    """Test that ingestion inserts only items not already stored."""
+    service = StoryService(test_db)
+    service.rss_client = FakeRSSClient([make_item(1), make_item(2)])
+    assert service.ingest_feeds() == 2
+
+    service.rss_client = FakeRSSClient([make_item(2), make_item(3), make_item(3)])
+    assert service.ingest_feeds() == 1
+
+    assert test_db.query(FeedItem).count() == 3
+
+
+def test_has_unreported_feed_items(test_db):
+    """Test that feed items already covered by the latest story do not count as new."""
+    now = datetime.now(timezone.utc)
+
+    def add_item(n):
+        item = FeedItem(
+            feed_url="http://example.com/rss",
+            feed_name="Example",
+            title=f"Article {n}",
+            link=f"http://example.com/{n}",
+            published_at=now,
+            content_hash=feed_item_hash(f"http://example.com/{n}", f"Article {n}"),
+        )
+        test_db.add(item)
+        test_db.commit()
+        return item
+
+    service = StoryService(test_db)
+    assert not service.has_unreported_feed_items()
+
+    first = add_item(1)
+    assert service.has_unreported_feed_items()
+
+    test_db.add(StoryVersion(
+        full_text="Story",
+        summary="Summary",
+        created_at=now - timedelta(minutes=1),
+        sources_snapshot={"feed_items": [{"id": first.id}], "item_count": 1},
+    ))
+    test_db.commit()
+    assert not service.has_unreported_feed_items()
+
+    add_item(2)
+    assert service.has_unreported_feed_items()
@@ -1,7 +1,7 @@
 // WebSocket client for real-time story updates
 
 import { writable } from 'svelte/store';
-import type { StoryVersion } from './api';
+import { api, type StoryVersion } from './api';
 
 type ConnectionStatus = 'connecting' | 'connected' | 'disconnected' | 'error';
 
@@ -14,6 +14,10 @@ class WebSocketClient {
 	public status = writable<ConnectionStatus>('disconnected');
 	public latestStory = writable<StoryVersion | null>(null);
 	public hasNewUpdate = writable(false);
+	public latestImage = writable<{ story_version_id: number; image_url: string } | null>(null);
+	// Unsaved text of the story being generated; cleared once it is published
+	public draftText = writable<string | null>(null);
+	private draftLength = 0;
 
 	// Dynamically determine WebSocket URL based on environment
 	// Called at connection time (browser-only) to avoid SSR issues
@@ -55,6 +59,15 @@ class WebSocketClient {
 					if ((data.type === 'initial' || data.type === 'update') && data.story) {
 						this.latestStory.set(data.story);
 						this.hasNewUpdate.set(true);
+					} else if (data.type === 'update_available' && data.story) {
+						// Updates only announce the new version; fetch its full text
+						this.fetchStory(data.story.id);
+					} else if (data.type === 'draft_delta') {
+						this.appendDraft(data.offset, data.delta);
+					} else if (data.type === 'draft_discarded') {
+						this.clearDraft();
+					} else if (data.type === 'image_update' && data.image) {
+						this.latestImage.set(data.image);
 					}
 				} catch (error) {
 					console.error('Error parsing WebSocket message:', error);
@@ -68,6 +81,7 @@ class WebSocketClient {
 
 			this.ws.onclose = () => {
 				console.log('WebSocket disconnected');
+				this.clearDraft();
 				this.status.set('disconnected');
 				this.scheduleReconnect();
 			};
@@ -92,6 +106,28 @@ class WebSocketClient {
 		this.status.set('disconnected');
 	}
 
+	private appendDraft(offset: number, delta: string) {
+		// Joined mid-generation or missed a frame: wait for the published story
+		if (offset !== this.draftLength) return;
+		this.draftText.update((text) => (text ?? '') + delta);
+		this.draftLength += delta.length;
+	}
+
+	private clearDraft() {
+		this.draftText.set(null);
+		this.draftLength = 0;
+	}
+
+	private async fetchStory(id: number) {
+		try {
+			this.latestStory.set(await api.getStoryById(id));
+			this.hasNewUpdate.set(true);
+			this.clearDraft();
+		} catch (error) {
+			console.error('Error fetching updated story:', error);
+		}
+	}
+
 	clearNewUpdate() {
 		this.hasNewUpdate.set(false);
 	}